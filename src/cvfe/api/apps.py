@@ -1,3 +1,4 @@
+import functools
 import logging
 import os
 from typing import Callable, ClassVar
@@ -52,6 +53,12 @@ class Settings(BaseSettings):
     USE_NGROK: ClassVar[bool] = os.environ.get("USE_NGROK", "False") == "True"
 
 
+@functools.lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Returns the settings of the app, created once per process"""
+    return Settings()
+
+
 def init_ngrok(host: str, port: int):
     # pyngrok should only ever be installed or initialized in a dev environment when this flag is set
     from pyngrok import ngrok
@@ -30,7 +30,7 @@ async def convert(
     form_5257: fastapi.UploadFile,
     form_5645: fastapi.UploadFile,
     post_url: Optional[str] = None,
-):
+) -> dict[str, dict[str, Any]]:
     try:
         # save files to disk
         input_path: Path = BASE_SOURCE_DIR / Path("x/")
@@ -50,10 +50,10 @@ async def convert(
             detail=str(e),
         )
     try:
-        data_dict: dict[str, Any] = process(src_dir=BASE_SOURCE_DIR)
+        # the return type is used by FastAPI to serialize the response
+        response: dict[str, dict[str, Any]] = process(src_dir=BASE_SOURCE_DIR)
 
         logger.info("Process finished")
-        response = data_dict
 
     except Exception as error:
         logger.exception(error)
@@ -1,11 +1,16 @@
 __all__ = [
     "dict_summarizer",
     "dict_to_csv",
+    "dict_to_csv_rows",
     "key_dropper",
+    "build_prefix_index",
+    "count_keys_by_prefix",
     "fillna_datetime",
     "aggregate_datetime",
     "tag_to_regex_compatible",
     "change_dtype",
+    "cast_value",
+    "parse_datetime",
     "flatten_dict",
     "xml_to_flattened_dict",
     "process_directory",
@@ -19,22 +24,34 @@ Contains implementation of functions that could be used for processing data ever
 
 import csv
 import datetime
+import functools
 import logging
 import os
 import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from fnmatch import fnmatch
-from typing import Any, Callable, Iterable, Optional, cast
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, cast
 
 import xmltodict
 from dateutil import parser
 
 from cvfe.data.constant import *
-from cvfe.data.preprocessor import FileTransformCompose
+
+if TYPE_CHECKING:  # `preprocessor` imports this module
+    from cvfe.data.preprocessor import FileTransformCompose
 
 # set logger
 logger = logging.getLogger(__name__)
 
+# document types where tags are matched literally (see `tag_to_regex_compatible`)
+_LITERAL_TAG_DOC_TYPES = (DocTypes.CANADA, DocTypes.CANADA_5257E, DocTypes.CANADA_5645E)
+
+# built once and shared by all date conversions in this module
+_DEFAULT_DATETIME = datetime.datetime(**DATEUTIL_DEFAULT_DATETIME)
+_PARSER = parser.parser()
+
 
 def drop(dictionary: dict[str, Any], keys: Iterable[str]) -> None:
     """Takes a dictionary and removes ``keys`` from it
@@ -135,10 +152,29 @@ def dict_to_csv(data_dict: dict[str, Any], path: str) -> None:
         path (str): Path to the output file (will be created if not exist)
     """
 
-    with open(path, "w") as f:
-        w = csv.DictWriter(f, data_dict.keys())
-        w.writeheader()
-        w.writerow(data_dict)
+    dict_to_csv_rows(header=data_dict.keys(), rows=(data_dict.values(),), path=path)
+
+
+def dict_to_csv_rows(
+    header: Iterable[str], rows: Iterable[Iterable[Any]], path: str
+) -> None:
+    """Writes a header and rows of values to a CSV file.
+
+    Note:
+        Values of each row must be in the same order as ``header``. Rows are
+        written as they are, so no per-row dictionary lookup is needed as
+        in :class:`csv.DictWriter`.
+
+    Args:
+        header (Iterable[str]): Column names
+        rows (Iterable[Iterable[Any]]): An iterable of rows of values
+        path (str): Path to the output file (will be created if not exist)
+    """
+
+    with open(path, "w", buffering=1 << 20, newline="") as f:
+        w = csv.writer(f)
+        w.writerow(header)
+        w.writerows(rows)
 
 
 def key_dropper(
@@ -168,9 +204,9 @@ def key_dropper(
 
     if regex:
         r = re.compile(string)
-        key_to_drop = list(filter(r.match, list(data_dict.keys())))
+        key_to_drop = list(filter(r.match, data_dict))
     else:
-        key_to_drop = [key for key in list(data_dict.keys()) if string in key]
+        key_to_drop = [key for key in data_dict if string in key]
 
     if exclude is not None:
         key_to_drop = [key for key in key_to_drop if exclude not in key]
@@ -184,6 +220,63 @@ def key_dropper(
     return None if inplace else data_dict_copy
 
 
+def build_prefix_index(data_dict: dict[str, Any]) -> dict[str, list[str]]:
+    """Takes a flattened dictionary and maps each dotted prefix of its keys to those keys
+
+    Examples:
+        >>> build_prefix_index({'P1.PD.FromDate': 1, 'P1.PD.ToDate': 2})
+        {'P1': ['P1.PD.FromDate', 'P1.PD.ToDate'], 'P1.PD': ['P1.PD.FromDate', 'P1.PD.ToDate']}
+
+    Note:
+        The index is a snapshot of ``data_dict``. It is meant to be built once per
+        document and passed as ``prefix_index`` to functions such as
+        :func:`aggregate_datetime` and :func:`fillna_datetime`, so they do not have
+        to scan all keys on each call. Keys dropped afterwards are ignored by
+        those functions, but keys added afterwards are not indexed.
+
+    Args:
+        data_dict (dict[str, Any]): A flattened dictionary
+
+    Returns:
+        dict[str, list[str]]:
+            A dictionary where keys are all prefixes ending right before a ``'.'``
+            and values are the keys of ``data_dict`` starting with that prefix
+            (in the order of ``data_dict``).
+    """
+
+    index = defaultdict(list)
+    for key in data_dict:
+        for i, char in enumerate(key):
+            if char == ".":
+                index[key[:i]].append(key)
+    return dict(index)
+
+
+def count_keys_by_prefix(
+    data_dict: dict[str, Any], prefixes: Iterable[str]
+) -> dict[str, int]:
+    """Counts the keys of a dictionary starting with each of given prefixes in a single pass
+
+    Examples:
+        >>> count_keys_by_prefix({'a.x': 1, 'a.y': 2, 'b.x': 3}, ('a.', 'c.'))
+        {'a.': 2, 'c.': 0}
+
+    Args:
+        data_dict (dict[str, Any]): A flattened dictionary
+        prefixes (Iterable[str]): Prefixes to count keys of ``data_dict`` for
+
+    Returns:
+        dict[str, int]: A dictionary of each prefix to the number of keys starting with it
+    """
+
+    counts = dict.fromkeys(prefixes, 0)
+    for key in data_dict:
+        for prefix in counts:
+            if key.startswith(prefix):
+                counts[prefix] += 1
+    return counts
+
+
 def fillna_datetime(
     data_dict: dict[str, Any],
     key_base_name: str,
@@ -191,6 +284,7 @@ def fillna_datetime(
     doc_type: DocTypes,
     one_sided: str | bool = False,
     inplace: bool = False,
+    prefix_index: Optional[dict[str, list[str]]] = None,
 ) -> Optional[dict[str, Any]]:
     """Takes names of two keys with dates value (start, end) and fills them with a predefined value
 
@@ -210,6 +304,9 @@ def fillna_datetime(
 
         inplace (bool, optional): whether or not use an inplace
             operation. Defaults to False.
+        prefix_index (Optional[dict[str, list[str]]], optional): Index of keys
+            of ``data_dict`` created via :func:`build_prefix_index`. If provided,
+            only keys under ``key_base_name`` are searched. Defaults to None.
 
     Note:
         In transformation operations such as :func:`aggregate_datetime` function,
@@ -222,21 +319,18 @@ def fillna_datetime(
             which was filled to the exact same date via ``date``.
     """
 
-    if not one_sided:
-        r = re.compile(tag_to_regex_compatible(string=key_base_name, doc_type=doc_type))
-    else:
-        r = re.compile(
-            tag_to_regex_compatible(string=key_base_name, doc_type=doc_type)
-            + "\.(From|To).+"
-        )
-    keys_to_fillna_names = list(filter(r.match, list(data_dict.keys())))
-    for key in data_dict[keys_to_fillna_names]:
-        if inplace:
-            data_dict[key] = fillna(original=data_dict[key], new=date)
-        else:
-            data_dict_copy = deepcopy(data_dict_copy)
-            data_dict_copy[key] = fillna(original=data_dict_copy[key], new=date)
-    return None if inplace else data_dict
+    keys_to_fillna_names = _select_base_keys(
+        data_dict=data_dict,
+        key_base_name=key_base_name,
+        doc_type=doc_type,
+        require_from_to=bool(one_sided),
+        prefix_index=prefix_index,
+    )
+    # only top-level values are replaced, so a shallow copy is enough
+    target = data_dict if inplace else data_dict.copy()
+    for key in keys_to_fillna_names:
+        target[key] = fillna(original=target[key], new=date)
+    return None if inplace else target
 
 
 def aggregate_datetime(
@@ -248,6 +342,7 @@ def aggregate_datetime(
     one_sided: Optional[str] = None,
     reference_date: Optional[str] = None,
     current_date: Optional[str] = None,
+    prefix_index: Optional[dict[str, list[str]]] = None,
     **kwargs,
 ) -> dict[str, Any]:
     """Takes two keys of dates in string form and calculates the period of them
@@ -273,6 +368,9 @@ def aggregate_datetime(
 
         reference_date (Optional[str], optional): Assumed ``reference_date`` (t0<t1). Defaults to None.
         current_date (Optional[str], optional): Assumed ``current_date`` (t1>t0). Defaults to None.
+        prefix_index (Optional[dict[str, list[str]]], optional): Index of keys
+            of ``data_dict`` created via :func:`build_prefix_index`. If provided,
+            only keys under ``key_base_name`` are searched. Defaults to None.
         default_datetime: accepts datetime.datetime_ to set default date
             for dateutil.parser.parse_.
 
@@ -286,24 +384,17 @@ def aggregate_datetime(
     .. _dateutil.parser.parse: https://dateutil.readthedocs.io/en/stable/parser.html
     """
 
-    default_datetime = datetime.datetime(
-        year=DATEUTIL_DEFAULT_DATETIME["year"],
-        month=DATEUTIL_DEFAULT_DATETIME["month"],
-        day=DATEUTIL_DEFAULT_DATETIME["day"],
+    default_datetime = kwargs.get("default_datetime", _DEFAULT_DATETIME)
+
+    # when one_sided, we no longer have *From* or *To*
+    aggregated_key_name = key_base_name + "." + new_key_name
+    keys_to_aggregate_names = _select_base_keys(
+        data_dict=data_dict,
+        key_base_name=key_base_name,
+        doc_type=doc_type,
+        require_from_to=one_sided is None,
+        prefix_index=prefix_index,
     )
-    default_datetime = kwargs.get("default_datetime", default_datetime)
-
-    aggregated_key_name = None
-    if one_sided is None:
-        aggregated_key_name = key_base_name + "." + new_key_name
-        r = re.compile(
-            tag_to_regex_compatible(string=key_base_name, doc_type=doc_type)
-            + "\.(From|To).+"
-        )
-    else:  # when one_sided, we no longer have *From* or *To*
-        aggregated_key_name = key_base_name + "." + new_key_name
-        r = re.compile(tag_to_regex_compatible(string=key_base_name, doc_type=doc_type))
-    keys_to_aggregate_names = list(filter(r.match, list(data_dict.keys())))
 
     # *.FromDate and *.ToDate --> *.Period
     key_from_date = reference_date
@@ -319,28 +410,28 @@ def aggregate_datetime(
         to_date = [col for col in keys_to_aggregate_names if "To" in col][0]
 
     if isinstance(key_to_date, str):
-        key_to_date = parser.parse(key_to_date, default=default_datetime)
+        key_to_date = _PARSER.parse(key_to_date, default=default_datetime)
 
     if key_from_date is None:
         # ignore reference_date if from_date exists
         #   to able to use already parsed data from fillna
         if not isinstance(data_dict[from_date], datetime.datetime):
             data_dict[from_date] = (
-                parser.parse(data_dict[from_date], default=default_datetime)
+                _PARSER.parse(data_dict[from_date], default=default_datetime)
                 if data_dict[from_date] is not None
                 else data_dict[from_date]
             )
         key_from_date = data_dict[from_date]
     else:
         if isinstance(key_from_date, str):
-            key_from_date = parser.parse(key_from_date, default=default_datetime)
+            key_from_date = _PARSER.parse(key_from_date, default=default_datetime)
 
     if key_to_date is None:
         # ignore current_date if to_date exists
         #   to able to use already parsed data from fillna
         if not isinstance(data_dict[to_date], datetime.datetime):
             data_dict[to_date] = (
-                parser.parse(data_dict[to_date], default=default_datetime)
+                _PARSER.parse(data_dict[to_date], default=default_datetime)
                 if data_dict[to_date] is not None
                 else data_dict[to_date]
             )
@@ -348,7 +439,7 @@ def aggregate_datetime(
         key_to_date = data_dict[to_date]
     else:
         if isinstance(key_to_date, str):
-            key_to_date = parser.parse(key_to_date, default=default_datetime)
+            key_to_date = _PARSER.parse(key_to_date, default=default_datetime)
 
     if if_nan is not None:
         if if_nan == "skip":
@@ -367,6 +458,7 @@ def aggregate_datetime(
     return data_dict
 
 
+@functools.lru_cache(maxsize=4096)
 def tag_to_regex_compatible(string: str, doc_type: DocTypes) -> str:
     """Takes a string and makes it regex compatible for XML parsed string
 
@@ -374,6 +466,14 @@ def tag_to_regex_compatible(string: str, doc_type: DocTypes) -> str:
         This is specialized method and it may be better to override it for
         your own case.
 
+    Note:
+        Results are cached, as the same tags are converted for every document.
+
+    Note:
+        :func:`fillna_datetime` and :func:`aggregate_datetime` match tags of the
+        document types escaped here with plain string comparisons by default and
+        only compile regexes for other document types.
+
     Args:
         string (str): input string to get manipulated
         doc_type (DocTypes): specified :class:`DocTypes <cvfe.data.constant.DocTypes>`
@@ -383,16 +483,110 @@ def tag_to_regex_compatible(string: str, doc_type: DocTypes) -> str:
         str: A modified string
     """
 
-    if (
-        doc_type == DocTypes.CANADA_5257E
-        or doc_type == DocTypes.CANADA_5645E
-        or doc_type == DocTypes.CANADA
-    ):
-        string = string.replace(".", "\.").replace("[", "\[").replace("]", "\]")
+    # nothing to escape
+    if "." not in string and "[" not in string and "]" not in string:
+        return string
+
+    if doc_type in _LITERAL_TAG_DOC_TYPES:
+        string = string.replace(".", r"\.").replace("[", r"\[").replace("]", r"\]")
 
     return string
 
 
+def _match_base_keys(
+    keys: Iterable[str], key_base_name: str, require_from_to: bool
+) -> list[str]:
+    """Takes keys and returns those starting with ``key_base_name`` without regex
+
+    Equivalent to matching the regex of an escaped ``key_base_name``,
+    followed by ``\\.(From|To).+`` if ``require_from_to``.
+
+    Args:
+        keys (Iterable[str]): Keys to be searched
+        key_base_name (str): Literal base key name
+        require_from_to (bool): Only match ``key_base_name.From*``
+            and ``key_base_name.To*`` keys
+
+    Returns:
+        list[str]: Matched keys in the order of ``keys``
+    """
+
+    if not require_from_to:
+        return [k for k in keys if k.startswith(key_base_name)]
+
+    prefixes = (key_base_name + ".From", key_base_name + ".To")
+    # at least one character must follow `From` or `To`
+    return [k for k in keys if k.startswith(prefixes) and k not in prefixes]
+
+
+def _select_base_keys(
+    data_dict: dict[str, Any],
+    key_base_name: str,
+    doc_type: DocTypes,
+    require_from_to: bool,
+    prefix_index: Optional[dict[str, list[str]]] = None,
+) -> list[str]:
+    """Finds keys of ``data_dict`` that belong to ``key_base_name``
+
+    See :func:`fillna_datetime` and :func:`aggregate_datetime` for the arguments.
+    """
+
+    keys: Iterable[str] = data_dict
+    if prefix_index is not None and require_from_to:
+        # only `key_base_name.*` keys can match `.From*` or `.To*`
+        keys = [k for k in prefix_index.get(key_base_name, []) if k in data_dict]
+
+    # fast path: literal tags need no regex
+    if doc_type in _LITERAL_TAG_DOC_TYPES:
+        return _match_base_keys(keys, key_base_name, require_from_to)
+
+    pattern = tag_to_regex_compatible(string=key_base_name, doc_type=doc_type)
+    if require_from_to:
+        pattern += r"\.(From|To).+"
+    return list(filter(re.compile(pattern).match, keys))
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_datetime(
+    timestr: str, default: Optional[datetime.datetime] = None
+) -> datetime.datetime:
+    """Parses a date string, trying the formats of XFA forms before dateutil.parser.parse_
+
+    XFA forms mostly contain ISO dates (e.g. ``YYYY-MM-DD``) or years (``YYYY``).
+    The former is parsed by :meth:`datetime.datetime.fromisoformat` which is
+    implemented in C and the latter needs no parsing at all. Anything else
+    is parsed by dateutil.parser.parse_.
+
+    Note:
+        Results are cached, as many date fields share the same fill value and
+        the same dates recur across documents. Dates are immutable, so sharing
+        them is safe.
+
+    Args:
+        timestr (str): A string containing a date
+        default (Optional[datetime.datetime], optional): The datetime that missing
+            parts of ``timestr`` are taken from. Defaults to None, i.e.
+            :data:`DATEUTIL_DEFAULT_DATETIME <cvfe.data.constant.DATEUTIL_DEFAULT_DATETIME>`.
+
+    Returns:
+        datetime.datetime: The parsed date
+    """
+
+    if default is None:
+        default = _DEFAULT_DATETIME
+
+    try:
+        return datetime.datetime.fromisoformat(timestr)
+    except ValueError:
+        pass
+    if len(timestr) == 4 and timestr.isdigit():
+        try:
+            return default.replace(year=int(timestr))
+        except ValueError:
+            pass
+    return _PARSER.parse(timestr, default=default)
+
+
 def change_dtype(
     data_dict: dict[str, Any],
     key_name: str,
@@ -405,7 +599,9 @@ def change_dtype(
     Args:
         data_dict (dict[str, Any]): A dictionary that ``key_name`` will be searched on
         key_name (str): Desired key name of the dictionary
-        dtype (Callable): target data type as a function e.g. ``float``
+        dtype (Callable): target data type as a function e.g. ``float``. Dates are
+            parsed via :func:`parse_datetime` or dateutil.parser.parse_ and
+            stored in ISO format.
         if_nan (str, Callable, optional): What to do with None s (NaN).
             Defaults to ``'skip'``. Could be a function or predefined states as follow:
 
@@ -426,12 +622,7 @@ def change_dtype(
             for the calculation of period are dropped.
     """
 
-    default_datetime = datetime.datetime(
-        year=DATEUTIL_DEFAULT_DATETIME["year"],
-        month=DATEUTIL_DEFAULT_DATETIME["month"],
-        day=DATEUTIL_DEFAULT_DATETIME["day"],
-    )
-    default_datetime = kwargs.get("default_datetime", default_datetime)
+    default_datetime = kwargs.get("default_datetime", _DEFAULT_DATETIME)
 
     # define `func` for different cases of predefined logics
     if isinstance(if_nan, str):  # predefined `if_nan` cases
@@ -452,56 +643,9 @@ def change_dtype(
     else:
         pass
 
-    def standardize(value: Any) -> Any:
-        """Takes a value and make it standard for the target function that is going to parse it
-
-        Args:
-            value (Any): the input value that need to be standardized
-
-        Note:
-            This is mostly hardcoded and cannot be written better (I think!). So, you can
-            remove it entirely, and see what errors you get, and change this accordingly to
-            errors and exceptions you get.
-
-        Returns:
-            Any: Standardized value
-        """
-        if dtype == parser.parse:  # datetime parser
-            try:
-                parser.parse(value)
-            except ValueError:  # bad input format for `parser.parse`
-                value = cast(str, value)
-                # we want YYYY-MM-DD
-                # MMDDYYYY format (Canada Common Forms)
-                if len(value) == 8 and value.isnumeric():
-                    value = f"{value[4:]}-{value[2:4]}-{value[0:2]}"
-                # fix values
-                if value[5:7] == "02" and value[8:10] == "30":
-                    # using >28 for February
-                    value = "28".join(value.rsplit("30", 1))
-        return value
-
-    def apply_dtype(x: Any) -> Any:
-        """Handles the default ``datetime.datetime`` for ``dateutil.parser.parse`` during casting dtypes
-
-        Note:
-            This function is only used to handle for a specific case of
-            casting it is hardcoded
-
-        Args:
-            x (Any): Any value that its dtype going to be casted
-
-        Returns:
-            Any: ``x`` that is casted to a new type
-        """
-        if dtype == parser.parse:
-            return dtype(x, default=default_datetime).isoformat()
-        return dtype(x)
-
     # apply the rules and data type change
-    data_dict[key_name] = data_dict[key_name]
     data_dict[key_name] = (
-        apply_dtype(standardize(data_dict[key_name]))
+        cast_value(data_dict[key_name], dtype, default_datetime)
         if data_dict[key_name] is not None
         else func(data_dict[key_name])
     )
@@ -509,6 +653,56 @@ def change_dtype(
     return data_dict
 
 
+def cast_value(
+    value: Any,
+    dtype: Callable,
+    default_datetime: datetime.datetime = _DEFAULT_DATETIME,
+) -> Any:
+    """Casts a (not ``None``) value to a new data type as done by :func:`change_dtype`
+
+    Args:
+        value (Any): Any value that its dtype going to be casted
+        dtype (Callable): target data type as a function e.g. ``float``. Dates are
+            parsed via :func:`parse_datetime` or dateutil.parser.parse_ and
+            returned in ISO format. Already parsed dates are only formatted.
+        default_datetime (datetime.datetime, optional): default date for the
+            date parsers. Defaults to
+            :data:`DATEUTIL_DEFAULT_DATETIME <cvfe.data.constant.DATEUTIL_DEFAULT_DATETIME>`.
+
+    Returns:
+        Any: ``value`` that is casted to a new type
+    """
+
+    # datetime parsers
+    if dtype is parse_datetime:
+        parse_date = parse_datetime
+    elif dtype == parser.parse:
+        parse_date = _PARSER.parse
+    else:
+        return dtype(value)
+    # already parsed, e.g. a fill value computed from other dates
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+
+    # make the value standard for the date parser
+    # Note: This is mostly hardcoded and cannot be written better (I think!). So, you
+    #   can remove it entirely, and see what errors you get, and change this
+    #   accordingly to errors and exceptions you get.
+    try:
+        return parse_date(value, default=default_datetime).isoformat()
+    except ValueError:  # bad input format for `parse_date`
+        value = cast(str, value)
+        # we want YYYY-MM-DD
+        # MMDDYYYY format (Canada Common Forms)
+        if len(value) == 8 and value.isnumeric():
+            value = f"{value[4:]}-{value[2:4]}-{value[0:2]}"
+        # fix values
+        if value[5:7] == "02" and value[8:10] == "30":
+            # using >28 for February
+            value = "28".join(value.rsplit("30", 1))
+    return parse_date(value, default=default_datetime).isoformat()
+
+
 def flatten_dict(dictionary: dict[str, Any]) -> dict[str, Any]:
     """Takes a (nested) multilevel dictionary and flattens it
 
@@ -526,23 +720,31 @@ def flatten_dict(dictionary: dict[str, Any]) -> dict[str, Any]:
 
     """
 
-    def items():
-        if isinstance(dictionary, dict):
-            for key, value in dictionary.items():
-                # nested subtree
-                if isinstance(value, dict):
-                    for subkey, subvalue in flatten_dict(value).items():
-                        yield f"{key}.{subkey}", subvalue
-                # nested list
-                elif isinstance(value, list):
-                    for num, elem in enumerate(value):
-                        for subkey, subvalue in flatten_dict(elem).items():
-                            yield f"{key}.[{num}].{subkey}", subvalue
-                # everything else (only leafs should remain)
-                else:
-                    yield key, value
-
-    return dict(items())
+    flattened: dict[str, Any] = {}
+    # keys of the current branch, joined only once a leaf is reached
+    path: list[str] = []
+
+    def walk(node: dict[str, Any]) -> None:
+        for key, value in node.items():
+            path.append(key)
+            # nested subtree
+            if isinstance(value, dict):
+                walk(value)
+            # nested list
+            elif isinstance(value, list):
+                for num, elem in enumerate(value):
+                    if isinstance(elem, dict):
+                        path.append(f"[{num}]")
+                        walk(elem)
+                        path.pop()
+            # everything else (only leafs should remain)
+            else:
+                flattened[".".join(path)] = value
+            path.pop()
+
+    if isinstance(dictionary, dict):
+        walk(dictionary)
+    return flattened
 
 
 def xml_to_flattened_dict(xml: str) -> dict:
@@ -562,8 +764,9 @@ def xml_to_flattened_dict(xml: str) -> dict:
 def process_directory(
     src_dir: str,
     dst_dir: str,
-    compose: FileTransformCompose,
+    compose: "FileTransformCompose",
     file_pattern: str = "*",
+    max_workers: Optional[int] = 1,
 ) -> None:
     """Transforms all files that match pattern in given dir and saves new files preserving dir structure
 
@@ -581,6 +784,10 @@ def process_directory(
             see :class:`Compose <cvfe.data.preprocessor.FileTransformCompose>`.
         file_pattern (str, optional): pattern to match files, default to ``'*'`` for
             all files. Defaults to ``'*'``.
+        max_workers (Optional[int], optional): Number of worker processes used to
+            transform files, ``1`` transforms them one by one in this process and
+            ``None`` uses ``os.cpu_count()`` workers. Worth it for many files, as
+            each worker pays the process startup once. Defaults to 1.
     """
 
     assert src_dir != dst_dir, "Source and destination dir must differ."
@@ -588,20 +795,33 @@ def process_directory(
         src_dir += "/"
 
     # process directories
+    # `os.walk` yields each `dirpath` once, so each destination dir is made once
+    in_fnames: list[str] = []  # original paths
+    out_fnames: list[str] = []  # processed paths
     for dirpath, _, all_filenames in os.walk(src_dir):
         # filter out files that match pattern only
-        filenames = filter(lambda fname: fnmatch(fname, file_pattern), all_filenames)
-        dirname = dirpath[len(dirpath) - dirpath[::-1].find("/") :]
+        filenames = [fname for fname in all_filenames if fnmatch(fname, file_pattern)]
+        dirname = os.path.basename(dirpath.rstrip("/"))
         logger.info(f'Processing directory="{dirname}"...')
         if filenames:
             dir_ = os.path.join(dst_dir, dirpath.replace(src_dir, ""))
             os.makedirs(dir_, exist_ok=True)
             for fname in filenames:
-                in_fname = os.path.join(dirpath, fname)  # original path
-                out_fname = os.path.join(dir_, fname)  # processed path
-                compose(in_fname, out_fname)  # composition of transforms
-                logger.info(f'Processed file="{fname}"')
-        logger.info(f"Processed the data entry.")
+                in_fnames.append(os.path.join(dirpath, fname))
+                out_fnames.append(os.path.join(dir_, fname))
+
+    # composition of transforms
+    if max_workers == 1:
+        for in_fname, out_fname in zip(in_fnames, out_fnames):
+            compose(in_fname, out_fname)
+            logger.info(f'Processed file="{os.path.basename(in_fname)}"')
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for in_fname, _ in zip(
+                in_fnames, executor.map(compose, in_fnames, out_fnames)
+            ):
+                logger.info(f'Processed file="{os.path.basename(in_fname)}"')
+    logger.info(f"Processed the data entry.")
 
 
 def extended_dict_get(
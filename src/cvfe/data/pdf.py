@@ -2,6 +2,7 @@ __all__ = ["PDFIO", "XFAPDF", "CanadaXFA"]
 
 import re
 import xml.etree.ElementTree as et
+from collections import deque
 from enum import Enum
 from typing import Any
 
@@ -37,6 +38,11 @@ class PDFIO:
     def find_in_dict(self, needle: Any, haystack: Any) -> Any:
         """Looks for the value of a key inside a nested dictionary
 
+        Note:
+            The search is breadth-first and each nested dictionary is visited
+            only once, so cyclic references (common in PDF object graphs) do
+            not cause infinite recursion.
+
         Args:
             needle (Any): Key to look for
             haystack (Any): Dictionary to look in. Can be a dict inside
@@ -45,17 +51,23 @@ class PDFIO:
         Returns:
             Any: The value of key ``needle``
         """
-        for key in haystack.keys():
-            try:
-                value = haystack[key]
-            except:
+        queue = deque([haystack])
+        seen: set[int] = set()
+        while queue:
+            current = queue.popleft()
+            if id(current) in seen:
                 continue
-            if key == needle:
-                return value
-            if isinstance(value, dict):
-                x = self.find_in_dict(needle, value)
-                if x is not None:
-                    return x
+            seen.add(id(current))
+            for key in current.keys():
+                try:
+                    value = current[key]
+                except:
+                    continue
+                if key == needle:
+                    return value
+                if isinstance(value, dict):
+                    queue.append(value)
+        return None
 
 
 class XFAPDF(PDFIO):
@@ -81,7 +93,12 @@ class XFAPDF(PDFIO):
 
         pdf_object = open(pdf_path, "rb")
         pdf = pypdf.PdfReader(stream=pdf_object, strict=True)
-        xfa = self.find_in_dict("/XFA", pdf.resolved_objects)
+        try:
+            # XFA forms are referenced from the document catalog
+            xfa = pdf.trailer["/Root"]["/AcroForm"]["/XFA"]
+        except KeyError:
+            # non-standard PDFs: search the whole object graph
+            xfa = self.find_in_dict("/XFA", pdf.resolved_objects)
         # `datasets` keyword contains filled forms in XFA array
         xml = xfa[xfa.index("datasets") + 1].get_object().get_data()
         xml = str(xml)  # convert bytes to str
@@ -8,22 +8,294 @@ __all__ = [
 ]
 
 import csv
+import functools
 import logging
 import shutil
-from typing import Any, Callable, Optional
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
 
 import pikepdf
-from dateutil import parser
 from dateutil.relativedelta import *
 
 from cvfe.configs import CANADA_COUNTRY_CODE_TO_NAME
 from cvfe.data import functional
 from cvfe.data.constant import *
+from cvfe.data.functional import parse_datetime
 from cvfe.data.pdf import CanadaXFA
 
 # config logger
 logger = logging.getLogger(__name__)
 
+# Canada PDF to XML, it is stateless so one instance serves all documents
+_CANADA_XFA = CanadaXFA()
+
+_Row = TypeVar("_Row", bound=tuple)
+
+
+def _intern_keys(*rows: _Row) -> tuple[_Row, ...]:
+    """Builds a table of rows with their keys (first items) interned via :func:`sys.intern`
+
+    Flattened keys contain ``'.'`` and ``'['``, so CPython does not intern them as
+    literals. Interning them keeps a single copy of each key of the tables below.
+    """
+    return tuple((sys.intern(row[0]), *row[1:]) for row in rows)
+
+
+# placeholders in the schemas below for fill values only known per document
+_FORM_DATE = object()  # the date the form was filled, i.e. "today" for the form
+_DOB_DATE = object()  # date of birth of the applicant
+_PASSPORT_EXPIRY_DATE = object()  # one year before `_FORM_DATE`
+
+# (key, dtype, if_nan, value) of fields cast one by one in the 5257E form
+_CANADA_5257E_SCHEMA: tuple[tuple[str, Callable, str, Any], ...] = _intern_keys(
+    # service language: 1=En, 2=Fr -> need to be changed to categorical
+    ("P1.PD.ServiceIn.ServiceIn", int, "skip", None),
+    # current country of residency status: string -> categorical
+    (
+        "P1.PD.CurrCOR.Row2.Status",
+        int,
+        "fill",
+        int(CanadaFillna.RESIDENCY_STATUS_5257E),
+    ),
+    # current country of residency other description: bool -> categorical
+    (
+        "P1.PD.CurrCOR.Row2.Other",
+        bool,
+        "fill",
+        CanadaFillna.OTHER_DESCRIPTION_INDICATOR_5257E,
+    ),
+    # current country of residency period: None -> Datetime (=age period)
+    ("P1.PD.CurrCOR.Row2.FromDate", parse_datetime, "fill", _DOB_DATE),
+    ("P1.PD.CurrCOR.Row2.ToDate", parse_datetime, "fill", _FORM_DATE),
+    # country where applying status: string -> categorical
+    ("P1.PD.CWA.Row2.Status", int, "fill", int(CanadaFillna.RESIDENCY_STATUS_5257E)),
+    # country where applying other: string -> categorical
+    (
+        "P1.PD.CWA.Row2.Other",
+        bool,
+        "fill",
+        CanadaFillna.OTHER_DESCRIPTION_INDICATOR_5257E,
+    ),
+    # country where applying period: datetime -> int days
+    ("P1.PD.CWA.Row2.FromDate", parse_datetime, "fill", _FORM_DATE),
+    ("P1.PD.CWA.Row2.ToDate", parse_datetime, "fill", _FORM_DATE),
+    # marriage period: datetime -> int days
+    ("P1.MS.SecA.DateOfMarr", parse_datetime, "fill", _FORM_DATE),
+    # previous spouse age period: string -> datetime -> int days
+    (
+        "P2.MS.SecA.PrevSpouseDOB.DOBYear",
+        parse_datetime,
+        "fill",
+        _FORM_DATE,
+    ),
+    # previous marriage period: string -> datetime -> int days
+    ("P2.MS.SecA.FromDate", parse_datetime, "fill", _FORM_DATE),
+    ("P2.MS.SecA.ToDate.ToDate", parse_datetime, "fill", _FORM_DATE),
+    # expiry remaining period: datetime -> int days
+    # if None, fill with 1 year ago, ie. period=1year
+    (
+        "P2.MS.SecA.Psprt.ExpiryDate",
+        parse_datetime,
+        "fill",
+        _PASSPORT_EXPIRY_DATE,
+    ),
+    # purpose of visit: string, 8 states -> categorical (7 is other in the form)
+    (
+        "P3.DOV.PrpsRow1.PrpsOfVisit.PrpsOfVisit",
+        int,
+        "fill",
+        int(CanadaFillna.PURPOSE_OF_VISIT_5257E),
+    ),
+    # purpose of visit description: string -> binary
+    (
+        "P3.DOV.PrpsRow1.Other.Other",
+        bool,
+        "fill",
+        CanadaFillna.OTHER_DESCRIPTION_INDICATOR_5257E,
+    ),
+    # how long going to stay: None -> datetime (0 days)
+    ("P3.DOV.PrpsRow1.HLS.FromDate", parse_datetime, "fill", _FORM_DATE),
+    ("P3.DOV.PrpsRow1.HLS.ToDate", parse_datetime, "fill", _FORM_DATE),
+    # fund to integer
+    ("P3.DOV.PrpsRow1.Funds.Funds", int, "skip", None),
+    # higher education period: string -> datetime -> int days
+    ("P3.Edu.Edu_Row1.FromYear", parse_datetime, "fill", _FORM_DATE),
+    ("P3.Edu.Edu_Row1.ToYear", parse_datetime, "fill", _FORM_DATE),
+    # medical details: string -> binary
+    (
+        "P3.BGI.Details.MedicalDetails",
+        bool,
+        "fill",
+        CanadaFillna.INDICATOR_FIELD_5257E,
+    ),
+    # other than medical: string -> binary
+    ("P3.BGI.otherThanMedic", bool, "fill", CanadaFillna.INDICATOR_FIELD_5257E),
+)
+
+# (field, dtype, if_nan, value) of each previous country of residency row in 5257E
+_CANADA_5257E_PREV_COR_ROW_SCHEMA: tuple[tuple[str, Callable, str, Any], ...] = (
+    # previous country of residency: string -> categorical
+    ("Country", str, "fill", CanadaFillna.PREVIOUS_COUNTRY_5257E),
+    # previous country of residency status: string -> categorical
+    ("Status", int, "fill", int(CanadaFillna.RESIDENCY_STATUS_5257E)),
+    # previous country of residency period: string -> datetime -> int days
+    ("FromDate", parse_datetime, "fill", _FORM_DATE),
+    ("ToDate", parse_datetime, "fill", _FORM_DATE),
+)
+
+# (field, dtype, if_nan, value) of each row of occupations in 5257E
+_CANADA_5257E_OCC_ROW_SCHEMA: tuple[tuple[str, Callable, str, Any], ...] = (
+    # occupation period: none -> string year -> int days
+    ("FromYear", parse_datetime, "fill", _FORM_DATE),
+    ("ToYear", parse_datetime, "fill", _FORM_DATE),
+    # occupation type: string -> categorical
+    ("Occ.Occ", str, "fill", CanadaFillna.OCCUPATION_5257E),
+    # occupation country: string -> categorical
+    ("Country.Country", str, "fill", CanadaFillna.COUNTRY_5257E),
+)
+
+# (key, dtype, if_nan, value) of fields cast one by one in the 5645E form
+_CANADA_5645E_SCHEMA: tuple[tuple[str, Callable, str, Any], ...] = _intern_keys(
+    # applicant marriage status: string to integer
+    (
+        "p1.SecA.App.ChdMStatus",
+        int,
+        "fill",
+        int(CanadaFillna.CHILD_MARRIAGE_STATUS_5645E),
+    ),
+    # spouse date of birth: string -> datetime
+    ("p1.SecA.Sps.SpsDOB", parse_datetime, "fill", _FORM_DATE),
+    # spouse country of birth: string -> categorical
+    ("p1.SecA.Sps.SpsCOB", str, "skip", None),
+    # mother date of birth: string -> datetime
+    ("p1.SecA.Mo.MoDOB", parse_datetime, "fill", _FORM_DATE),
+    # mother marriage status: int -> categorical
+    (
+        "p1.SecA.Mo.ChdMStatus",
+        int,
+        "fill",
+        int(CanadaFillna.CHILD_MARRIAGE_STATUS_5645E),
+    ),
+    # father date of birth: string -> datetime
+    ("p1.SecA.Fa.FaDOB", parse_datetime, "fill", _FORM_DATE),
+    # father marriage status: int -> categorical
+    (
+        "p1.SecA.Fa.ChdMStatus",
+        int,
+        "fill",
+        int(CanadaFillna.CHILD_MARRIAGE_STATUS_5645E),
+    ),
+)
+
+# (key, value) of categorical 5257E fields that only need missing values filled
+_CANADA_5257E_FILLS: tuple[tuple[str, str], ...] = _intern_keys(
+    # VisaType: String -> categorical
+    ("P1.PD.VisaType.VisaType", CanadaFillna.VISA_TYPE_5257E),
+    # Birth City: String -> categorical
+    ("P1.PD.PlaceBirthCity", CanadaFillna.PLACE_BIRTH_CITY_5257E),
+    # Birth country: string -> categorical
+    ("P1.PD.PlaceBirthCountry", CanadaFillna.COUNTRY_5257E),
+    # citizen of: string -> categorical
+    ("P1.PD.Citizenship.Citizenship", CanadaFillna.CITIZENSHIP_5257E),
+    # current country of residency: string -> categorical
+    ("P1.PD.CurrCOR.Row2.Country", CanadaFillna.COUNTRY_5257E),
+    # country where applying: string -> categorical
+    ("P1.PD.CWA.Row2.Country", CanadaFillna.COUNTRY_WHERE_APPLYING_5257E),
+    # previous marriage type of relationship
+    ("P2.MS.SecA.TypeOfRelationship", CanadaFillna.MARRIAGE_TYPE_5257E),
+    # passport country of issue: string -> categorical
+    (
+        "P2.MS.SecA.Psprt.CountryofIssue.CountryofIssue",
+        CanadaFillna.PASSPORT_COUNTRY_5257E,
+    ),
+    # native lang: string -> categorical
+    (
+        "P2.MS.SecA.Langs.languages.nativeLang.nativeLang",
+        CanadaFillna.NATIVE_LANG_5257E,
+    ),
+    # communication lang: Eng, Fr, both, none -> categorical
+    (
+        "P2.MS.SecA.Langs.languages.ableToCommunicate.ableToCommunicate",
+        CanadaFillna.LANGUAGES_ABLE_TO_COMMUNICATE_5257E,
+    ),
+    # national ID country of issue: string -> categorical
+    ("P2.natID.natIDdocs.CountryofIssue.CountryofIssue", CanadaFillna.ID_COUNTRY_5257E),
+    # relation to applicant of purpose of visit 01: string -> categorical
+    (
+        "P3.DOV.cntcts_Row1.RelationshipToMe.RelationshipToMe",
+        CanadaFillna.CONTACT_TYPE_5257E,
+    ),
+    # relation to applicant of purpose of visit 02: string -> categorical
+    ("P3.cntcts_Row2.Relationship.RelationshipToMe", CanadaFillna.CONTACT_TYPE_5257E),
+    # higher education country: string -> categorical
+    ("P3.Edu.Edu_Row1.Country.Country", CanadaFillna.COUNTRY_5257E),
+)
+
+# (key, value) of categorical 5645E fields that only need missing values filled
+_CANADA_5645E_FILLS: tuple[tuple[str, str], ...] = _intern_keys(
+    # spouse occupation type (issue #2): string -> categorical
+    ("p1.SecA.Sps.SpsOcc", CanadaFillna.OCCUPATION_5257E),
+    # mother occupation type (issue #2): string -> categorical
+    ("p1.SecA.Mo.MoOcc", CanadaFillna.OCCUPATION_5257E),
+    # father occupation type (issue #2): string -> categorical
+    ("p1.SecA.Fa.FaOcc", CanadaFillna.OCCUPATION_5257E),
+)
+
+# values of binary fields that mean True, anything else means False
+_YES = "Y"  # Y/N fields
+_CHECKED = "1"  # 1/0 fields (check boxes)
+
+# (key, true_value) of binary fields in the 5257E form
+_CANADA_5257E_FLAGS: tuple[tuple[str, str], ...] = _intern_keys(
+    # Adult binary state: adult=True or child=False
+    ("P1.AdultFlag", "adult"),
+    # AliasNameIndicator: 1=True, 0=False
+    ("P1.PD.AliasName.AliasNameIndicator.AliasNameIndicator", _YES),
+    # has previous country of residency: bool -> categorical
+    ("P1.PD.PCRIndicator", _YES),
+    # apply from country of residency (cwa=country where apply): Y=True, N=False
+    ("P1.PD.SameAsCORIndicator", _YES),
+    # previous marriage: Y=True, N=False
+    ("P2.MS.SecA.PrevMarrIndicator", _YES),
+    # language official test: bool -> binary
+    ("P2.MS.SecA.Langs.LangTest", _YES),
+    # have national ID: bool -> binary
+    ("P2.natID.q1.natIDIndicator", _YES),
+    # United States doc: bool -> binary
+    ("P2.USCard.q1.usCardIndicator", _YES),
+    # US Canada phone number: bool -> binary
+    ("P2.CI.cntct.PhnNums.Phn.CanadaUS", _CHECKED),
+    # US Canada alt phone number: bool -> binary
+    ("P2.CI.cntct.PhnNums.AltPhn.CanadaUS", _CHECKED),
+    # higher education: bool -> binary
+    ("P3.Edu.EduIndicator", _YES),
+    # without authentication stay, work, etc: bool -> binary
+    ("P3.noAuthStay", _YES),
+    # deported or refused entry: bool -> binary
+    ("P3.refuseDeport", _YES),
+    # previously applied: bool -> binary
+    ("P3.BGI2.PrevApply", _YES),
+    # criminal record: bool -> binary
+    ("P3.PWrapper.criminalRec", _YES),
+    # military record: bool -> binary
+    ("P3.PWrapper.Military.Choice", _YES),
+    # political, violent movement record: bool -> binary
+    ("P3.PWrapper.politicViol", _YES),
+    # witness of ill treatment: bool -> binary
+    ("P3.PWrapper.witnessIllTreat", _YES),
+)
+
+# (key, true_value) of binary fields in the 5645E form
+_CANADA_5645E_FLAGS: tuple[tuple[str, str], ...] = _intern_keys(
+    # spouse accompanying: coming=True or not_coming=False
+    ("p1.SecA.Sps.SpsAccomp", _CHECKED),
+    # mother accompanying: coming=True or not_coming=False
+    ("p1.SecA.Mo.MoAccomp", _CHECKED),
+    # father accompanying: coming=True or not_coming=False
+    ("p1.SecA.Fa.FaAccomp", _CHECKED),
+)
+
 
 class DataDictPreprocessor:
     """A set of utilities over dictionary of data to make it easier for data preprocessing
@@ -37,6 +309,8 @@ class DataDictPreprocessor:
     In this case, :func:`file_specific_basic_transform` needs to be implemented.
     """
 
+    __slots__ = ("data_dict",)
+
     def __init__(self, data_dict: Optional[dict[str, Any]] = None) -> None:
         """
 
@@ -100,20 +374,27 @@ class DataDictPreprocessor:
             **kwargs,
         )
 
-    def config_csv_to_dict(self, path: str) -> dict:
+    def config_csv_to_dict(self, path: str) -> dict[str, str]:
         """
         Take a config CSV and return a dictionary of key and values
 
+        Note:
+            The config file has no header and each row is a ``key,value`` pair.
+
         Args:
             path (str): string path to config file
+
+        Returns:
+            dict[str, str]: A dictionary of the first column to the second column
         """
 
         with open(path, newline="") as f:
-            config_dict = csv.DictReader(f, delimiter=",")
-        return config_dict
+            return {key: value for key, value in csv.reader(f, delimiter=",")}
 
 
 class CanadaDataDictPreprocessor(DataDictPreprocessor):
+    __slots__ = ("base_date", "config_path", "CANADA_COUNTRY_CODE_TO_NAME")
+
     def __init__(self, data_dict: Optional[dict[str, Any]] = None) -> None:
         super().__init__(data_dict)
         self.base_date = (
@@ -132,9 +413,9 @@ class CanadaDataDictPreprocessor(DataDictPreprocessor):
             string (str): input code string
         """
 
-        country = [c for c in self.CANADA_COUNTRY_CODE_TO_NAME.keys() if string in c]
-        if country:
-            return self.CANADA_COUNTRY_CODE_TO_NAME[country]
+        country = self.CANADA_COUNTRY_CODE_TO_NAME.get(string)
+        if country is not None:
+            return country
         else:
             logger.debug(
                 (
@@ -145,17 +426,27 @@ class CanadaDataDictPreprocessor(DataDictPreprocessor):
             return CanadaFillna.COUNTRY_CODE_5257E
 
     def file_specific_basic_transform(
-        self, doc_type: DocTypes, path: str
+        self,
+        doc_type: DocTypes,
+        path: str,
+        flattened_dict: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
-        canada_xfa = CanadaXFA()  # Canada PDF to XML
+        """See :meth:`DataDictPreprocessor.file_specific_basic_transform`
+
+        Args:
+            doc_type (DocTypes): The input document type
+                (see :class:`DocTypes <cvfe.data.constant.DocTypes>`)
+            path (str): Path to the input document
+            flattened_dict (Optional[dict[str, Any]], optional): The XFA content of
+                ``path`` already extracted as a flattened dictionary, e.g. by
+                :meth:`process_batch`. Only used for XFA forms. Defaults to None.
+        """
 
         if doc_type == DocTypes.CANADA_5257E:
-            # XFA to XML
-            xml = canada_xfa.extract_raw_content(path)
-            xml = canada_xfa.clean_xml_for_csv(xml=xml, type=DocTypes.CANADA_5257E)
-            # XML to flattened dict
-            data_dict = canada_xfa.xml_to_flattened_dict(xml=xml)
-            data_dict = canada_xfa.flatten_dict(data_dict)
+            # XFA to flattened dict
+            data_dict = flattened_dict
+            if data_dict is None:
+                data_dict = _extract_flattened(path=path, doc_type=doc_type)
             # clean flattened dict
             data_dict = functional.dict_summarizer(
                 data_dict,
@@ -169,409 +460,74 @@ class CanadaDataDictPreprocessor(DataDictPreprocessor):
             # drop pepeg keys
             functional.drop(dictionary=data_dict, keys=CANADA_5257E_DROP_COLUMNS)
 
-            # Adult binary state: adult=True or child=False
-            feature = "P1.AdultFlag"
-            data_dict[feature] = True if data_dict[feature] == "adult" else False
-
-            # service language: 1=En, 2=Fr -> need to be changed to categorical
-            feature = "P1.PD.ServiceIn.ServiceIn"
-            data_dict = self.change_dtype(key_name=feature, dtype=int, if_nan="skip")
-
-            # AliasNameIndicator: 1=True, 0=False
-            feature = "P1.PD.AliasName.AliasNameIndicator.AliasNameIndicator"
-            data_dict[feature] = True if data_dict[feature] == "Y" else False
-
-            # VisaType: String -> categorical
-            data_dict = self.change_dtype(
-                key_name="P1.PD.VisaType.VisaType",
-                dtype=str,
-                if_nan="fill",
-                value=CanadaFillna.VISA_TYPE_5257E,
-            )
-            # Birth City: String -> categorical
-            data_dict = self.change_dtype(
-                key_name="P1.PD.PlaceBirthCity",
-                dtype=str,
-                if_nan="fill",
-                value=CanadaFillna.PLACE_BIRTH_CITY_5257E,
-            )
-            # Birth country: string -> categorical
-            data_dict = self.change_dtype(
-                key_name="P1.PD.PlaceBirthCountry",
-                dtype=str,
-                if_nan="fill",
-                value=CanadaFillna.COUNTRY_5257E,
-            )
-            # citizen of: string -> categorical
-            data_dict = self.change_dtype(
-                key_name="P1.PD.Citizenship.Citizenship",
-                dtype=str,
-                if_nan="fill",
-                value=CanadaFillna.CITIZENSHIP_5257E,
-            )
-            # current country of residency: string -> categorical
-            data_dict = self.change_dtype(
-                key_name="P1.PD.CurrCOR.Row2.Country",
-                dtype=str,
-                if_nan="fill",
-                value=CanadaFillna.COUNTRY_5257E,
-            )
-            # current country of residency status: string -> categorical
-            data_dict = self.change_dtype(
-                key_name="P1.PD.CurrCOR.Row2.Status",
-                dtype=int,
-                if_nan="fill",
-                value=int(CanadaFillna.RESIDENCY_STATUS_5257E),
-            )
-            # current country of residency other description: bool -> categorical
-            data_dict = self.change_dtype(
-                key_name="P1.PD.CurrCOR.Row2.Other",
-                dtype=bool,
-                if_nan="fill",
-                value=CanadaFillna.OTHER_DESCRIPTION_INDICATOR_5257E,
-            )
             # validation date of information, i.e. current date: datetime
-            data_dict = self.change_dtype(
-                key_name="P3.Sign.C1CertificateIssueDate",
-                dtype=parser.parse,
-                if_nan="skip",
+            _apply(
+                data_dict,
+                "P3.Sign.C1CertificateIssueDate",
+                parse_datetime,
+                "skip",
+                None,
             )
+            # fill value of most of the date fields below
+            issue_date = data_dict["P3.Sign.C1CertificateIssueDate"]
             # keep it so we can access for other file if that was None
-            feature = "P3.Sign.C1CertificateIssueDate"
-            if data_dict[feature] is not None:
-                self.base_date = data_dict[feature]
+            if issue_date is not None:
+                self.base_date = issue_date
             # date of birth in year: string -> datetime
-            data_dict = self.change_dtype(
-                key_name="P1.PD.DOBYear", dtype=parser.parse, if_nan="skip"
-            )
-            # current country of residency period: None -> Datetime (=age period)
-            data_dict = self.change_dtype(
-                key_name="P1.PD.CurrCOR.Row2.FromDate",
-                dtype=parser.parse,
-                if_nan="fill",
-                value=data_dict["P1.PD.DOBYear"],
+            _apply(data_dict, "P1.PD.DOBYear", parse_datetime, "skip", None)
+            dob_date = data_dict["P1.PD.DOBYear"]
+            # passport expiry fill: 1 year before the issue date
+            temp_date = parse_datetime(issue_date) + relativedelta(years=-1)
+            # cast fields that are handled one by one
+            fills = {
+                _FORM_DATE: issue_date,
+                _DOB_DATE: dob_date,
+                _PASSPORT_EXPIRY_DATE: temp_date,
+            }
+            for key, dtype, if_nan, value in _CANADA_5257E_SCHEMA:
+                _apply(data_dict, key, dtype, if_nan, fills.get(value, value))
+            # values from XML are already strings, so only missing ones are filled
+            data_dict.update(
+                {k: v for k, v in _CANADA_5257E_FILLS if data_dict[k] is None}
+            )
+            # binary fields: true_value=True, anything else=False
+            for key, true_value in _CANADA_5257E_FLAGS:
+                data_dict[key] = data_dict[key] == true_value
+
+            # number of tags of the row sections below
+            tag_counts = functional.count_keys_by_prefix(
+                data_dict, ("P1.PD.PrevCOR.", "P3.Occ.OccRow")
             )
-            data_dict = self.change_dtype(
-                key_name="P1.PD.CurrCOR.Row2.ToDate",
-                dtype=parser.parse,
-                if_nan="fill",
-                value=data_dict["P3.Sign.C1CertificateIssueDate"],
-            )
-            # has previous country of residency: bool -> categorical
-            feature = "P1.PD.PCRIndicator"
-            data_dict[feature] = True if data_dict[feature] == "Y" else False
             # clean previous country of residency features
-            country_tag_list = [
-                c for c in list(data_dict.keys()) if "P1.PD.PrevCOR." in c
-            ]
             PREV_COUNTRY_MAX_FEATURES = 4
-            for i in range(len(country_tag_list) // PREV_COUNTRY_MAX_FEATURES):
-                # in XLA extracted file, this section start from `Row2` (ie. i+2)
-                i += 2
-                # previous country of residency 02: string -> categorical
-                data_dict = self.change_dtype(
-                    key_name="P1.PD.PrevCOR.Row" + str(i) + ".Country",
-                    dtype=str,
-                    if_nan="fill",
-                    value=CanadaFillna.PREVIOUS_COUNTRY_5257E,
-                )
-                # previous country of residency status 02: string -> categorical
-                data_dict = self.change_dtype(
-                    key_name="P1.PD.PrevCOR.Row" + str(i) + ".Status",
-                    dtype=int,
-                    if_nan="fill",
-                    value=int(CanadaFillna.RESIDENCY_STATUS_5257E),
-                )
-                # previous country of residency 02 period (P1.PD.PrevCOR.Row2): string -> datetime -> int days
-                data_dict = self.change_dtype(
-                    key_name="P1.PD.PrevCOR.Row" + str(i) + ".FromDate",
-                    dtype=parser.parse,
-                    if_nan="fill",
-                    value=data_dict["P3.Sign.C1CertificateIssueDate"],
-                )
-                data_dict = self.change_dtype(
-                    key_name="P1.PD.PrevCOR.Row" + str(i) + ".ToDate",
-                    dtype=parser.parse,
-                    if_nan="fill",
-                    value=data_dict["P3.Sign.C1CertificateIssueDate"],
+            n_rows = tag_counts["P1.PD.PrevCOR."] // PREV_COUNTRY_MAX_FEATURES
+            # in XLA extracted file, this section start from `Row2`
+            for i in range(2, n_rows + 2):
+                _apply_row(
+                    data_dict,
+                    f"P1.PD.PrevCOR.Row{i}",
+                    _CANADA_5257E_PREV_COR_ROW_SCHEMA,
+                    fills,
                 )
-            # apply from country of residency (cwa=country where apply): Y=True, N=False
-            feature = "P1.PD.SameAsCORIndicator"
-            data_dict[feature] = True if data_dict[feature] == "Y" else False
-            # country where applying: string -> categorical
-            data_dict = self.change_dtype(
-                key_name="P1.PD.CWA.Row2.Country",
-                dtype=str,
-                if_nan="fill",
-                value=CanadaFillna.COUNTRY_WHERE_APPLYING_5257E,
-            )
-            # country where applying status: string -> categorical
-            data_dict = self.change_dtype(
-                key_name="P1.PD.CWA.Row2.Status",
-                dtype=int,
-                if_nan="fill",
-                value=int(CanadaFillna.RESIDENCY_STATUS_5257E),
-            )
-            # country where applying other: string -> categorical
-            data_dict = self.change_dtype(
-                key_name="P1.PD.CWA.Row2.Other",
-                dtype=bool,
-                if_nan="fill",
-                value=CanadaFillna.OTHER_DESCRIPTION_INDICATOR_5257E,
-            )
-            # country where applying period: datetime -> int days
-            data_dict = self.change_dtype(
-                key_name="P1.PD.CWA.Row2.FromDate",
-                dtype=parser.parse,
-                if_nan="fill",
-                value=data_dict["P3.Sign.C1CertificateIssueDate"],
-            )
-            data_dict = self.change_dtype(
-                key_name="P1.PD.CWA.Row2.ToDate",
-                dtype=parser.parse,
-                if_nan="fill",
-                value=data_dict["P3.Sign.C1CertificateIssueDate"],
-            )
-            # marriage period: datetime -> int days
-            data_dict = self.change_dtype(
-                key_name="P1.MS.SecA.DateOfMarr",
-                dtype=parser.parse,
-                if_nan="fill",
-                value=data_dict["P3.Sign.C1CertificateIssueDate"],
-            )
-            # previous marriage: Y=True, N=False
-            feature = "P2.MS.SecA.PrevMarrIndicator"
-            data_dict[feature] = True if data_dict[feature] == "Y" else False
-            # previous marriage type of relationship
-            data_dict = self.change_dtype(
-                key_name="P2.MS.SecA.TypeOfRelationship",
-                dtype=str,
-                if_nan="fill",
-                value=CanadaFillna.MARRIAGE_TYPE_5257E,
-            )
-            # previous spouse age period: string -> datetime -> int days
-            data_dict = self.change_dtype(
-                key_name="P2.MS.SecA.PrevSpouseDOB.DOBYear",
-                dtype=parser.parse,
-                if_nan="fill",
-                value=data_dict["P3.Sign.C1CertificateIssueDate"],
-            )
-            # previous marriage period: string -> datetime -> int days
-            data_dict = self.change_dtype(
-                key_name="P2.MS.SecA.FromDate",
-                dtype=parser.parse,
-                if_nan="fill",
-                value=data_dict["P3.Sign.C1CertificateIssueDate"],
-            )
-            data_dict = self.change_dtype(
-                key_name="P2.MS.SecA.ToDate.ToDate",
-                dtype=parser.parse,
-                if_nan="fill",
-                value=data_dict["P3.Sign.C1CertificateIssueDate"],
-            )
-            # passport country of issue: string -> categorical
-            data_dict = self.change_dtype(
-                key_name="P2.MS.SecA.Psprt.CountryofIssue.CountryofIssue",
-                dtype=str,
-                if_nan="fill",
-                value=CanadaFillna.PASSPORT_COUNTRY_5257E,
-            )
-            # expiry remaining period: datetime -> int days
-            # if None, fill with 1 year ago, ie. period=1year
-            feature = "P3.Sign.C1CertificateIssueDate"
-            temp_date = parser.parse(data_dict[feature]) + relativedelta(years=-1)
-            data_dict = self.change_dtype(
-                key_name="P2.MS.SecA.Psprt.ExpiryDate",
-                dtype=parser.parse,
-                if_nan="fill",
-                value=temp_date,
-            )
-            # native lang: string -> categorical
-            data_dict = self.change_dtype(
-                key_name="P2.MS.SecA.Langs.languages.nativeLang.nativeLang",
-                dtype=str,
-                if_nan="fill",
-                value=CanadaFillna.NATIVE_LANG_5257E,
-            )
-            # communication lang: Eng, Fr, both, none -> categorical
-            data_dict = self.change_dtype(
-                key_name="P2.MS.SecA.Langs.languages.ableToCommunicate.ableToCommunicate",
-                dtype=str,
-                if_nan="fill",
-                value=CanadaFillna.LANGUAGES_ABLE_TO_COMMUNICATE_5257E,
-            )
-            # language official test: bool -> binary
-            feature = "P2.MS.SecA.Langs.LangTest"
-            data_dict[feature] = True if data_dict[feature] == "Y" else False
-            # have national ID: bool -> binary
-            feature = "P2.natID.q1.natIDIndicator"
-            data_dict[feature] = True if data_dict[feature] == "Y" else False
-            # national ID country of issue: string -> categorical
-            data_dict = self.change_dtype(
-                key_name="P2.natID.natIDdocs.CountryofIssue.CountryofIssue",
-                dtype=str,
-                if_nan="fill",
-                value=CanadaFillna.ID_COUNTRY_5257E,
-            )
-            # United States doc: bool -> binary
-            feature = "P2.USCard.q1.usCardIndicator"
-            data_dict[feature] = True if data_dict[feature] == "Y" else False
-            # US Canada phone number: bool -> binary
-            feature = "P2.CI.cntct.PhnNums.Phn.CanadaUS"
-            data_dict[feature] = True if data_dict[feature] == "1" else False
-            # US Canada alt phone number: bool -> binary
-            feature = "P2.CI.cntct.PhnNums.AltPhn.CanadaUS"
-            data_dict[feature] = True if data_dict[feature] == "1" else False
-            # purpose of visit: string, 8 states -> categorical
-            data_dict = self.change_dtype(
-                key_name="P3.DOV.PrpsRow1.PrpsOfVisit.PrpsOfVisit",
-                dtype=int,
-                if_nan="fill",
-                value=int(CanadaFillna.PURPOSE_OF_VISIT_5257E),
-            )  # 7 is other in the form
-            # purpose of visit description: string -> binary
-            data_dict = self.change_dtype(
-                key_name="P3.DOV.PrpsRow1.Other.Other",
-                dtype=bool,
-                if_nan="fill",
-                value=CanadaFillna.OTHER_DESCRIPTION_INDICATOR_5257E,
-            )
-            # how long going to stay: None -> datetime (0 days)
-            data_dict = self.change_dtype(
-                key_name="P3.DOV.PrpsRow1.HLS.FromDate",
-                dtype=parser.parse,
-                if_nan="fill",
-                value=data_dict["P3.Sign.C1CertificateIssueDate"],
-            )
-            data_dict = self.change_dtype(
-                key_name="P3.DOV.PrpsRow1.HLS.ToDate",
-                dtype=parser.parse,
-                if_nan="fill",
-                value=data_dict["P3.Sign.C1CertificateIssueDate"],
-            )
-            # fund to integer
-            data_dict = self.change_dtype(
-                key_name="P3.DOV.PrpsRow1.Funds.Funds", dtype=int, if_nan="skip"
-            )
-            # relation to applicant of purpose of visit 01: string -> categorical
-            data_dict = self.change_dtype(
-                key_name="P3.DOV.cntcts_Row1.RelationshipToMe.RelationshipToMe",
-                dtype=str,
-                if_nan="fill",
-                value=CanadaFillna.CONTACT_TYPE_5257E,
-            )
-            # relation to applicant of purpose of visit 02: string -> categorical
-            data_dict = self.change_dtype(
-                key_name="P3.cntcts_Row2.Relationship.RelationshipToMe",
-                dtype=str,
-                if_nan="fill",
-                value=CanadaFillna.CONTACT_TYPE_5257E,
-            )
-            # higher education: bool -> binary
-            feature = "P3.Edu.EduIndicator"
-            data_dict[feature] = True if data_dict[feature] == "Y" else False
-            # higher education period: string -> datetime -> int days
-            data_dict = self.change_dtype(
-                key_name="P3.Edu.Edu_Row1.FromYear",
-                dtype=parser.parse,
-                if_nan="fill",
-                value=data_dict["P3.Sign.C1CertificateIssueDate"],
-            )
-            data_dict = self.change_dtype(
-                key_name="P3.Edu.Edu_Row1.ToYear",
-                dtype=parser.parse,
-                if_nan="fill",
-                value=data_dict["P3.Sign.C1CertificateIssueDate"],
-            )
-            # higher education country: string -> categorical
-            data_dict = self.change_dtype(
-                key_name="P3.Edu.Edu_Row1.Country.Country",
-                dtype=str,
-                if_nan="fill",
-                value=CanadaFillna.COUNTRY_5257E,
-            )
             # field of study: string -> categorical
             feature = "P3.Edu.Edu_Row1.FieldOfStudy"
             data_dict[feature] = str(data_dict[feature])
             # clean occupation features
-            feature = "P3.Occ.OccRow"
-            occupation_tag_list = [c for c in list(data_dict.keys()) if feature in c]
             PREV_OCCUPATION_MAX_FEATURES = 9
-            for i in range(len(occupation_tag_list) // PREV_OCCUPATION_MAX_FEATURES):
-                i += 1  # in the form, it starts from Row1 (ie. i+1)
-                # occupation period 01: none -> string year -> int days
-                data_dict = self.change_dtype(
-                    key_name="P3.Occ.OccRow" + str(i) + ".FromYear",
-                    dtype=parser.parse,
-                    if_nan="fill",
-                    value=data_dict["P3.Sign.C1CertificateIssueDate"],
-                )
-                data_dict = self.change_dtype(
-                    key_name="P3.Occ.OccRow" + str(i) + ".ToYear",
-                    dtype=parser.parse,
-                    if_nan="fill",
-                    value=data_dict["P3.Sign.C1CertificateIssueDate"],
+            n_rows = tag_counts["P3.Occ.OccRow"] // PREV_OCCUPATION_MAX_FEATURES
+            # in the form, it starts from `Row1`
+            for i in range(1, n_rows + 1):
+                _apply_row(
+                    data_dict, f"P3.Occ.OccRow{i}", _CANADA_5257E_OCC_ROW_SCHEMA, fills
                 )
 
-                # occupation type 01: string -> categorical
-                data_dict = self.change_dtype(
-                    key_name="P3.Occ.OccRow" + str(i) + ".Occ.Occ",
-                    dtype=str,
-                    if_nan="fill",
-                    value=CanadaFillna.OCCUPATION_5257E,
-                )
-                # occupation country: string -> categorical
-                data_dict = self.change_dtype(
-                    key_name="P3.Occ.OccRow" + str(i) + ".Country.Country",
-                    dtype=str,
-                    if_nan="fill",
-                    value=CanadaFillna.COUNTRY_5257E,
-                )
-
-            # medical details: string -> binary
-            data_dict = self.change_dtype(
-                key_name="P3.BGI.Details.MedicalDetails",
-                dtype=bool,
-                if_nan="fill",
-                value=CanadaFillna.INDICATOR_FIELD_5257E,
-            )
-            # other than medical: string -> binary
-            data_dict = self.change_dtype(
-                key_name="P3.BGI.otherThanMedic",
-                dtype=bool,
-                if_nan="fill",
-                value=CanadaFillna.INDICATOR_FIELD_5257E,
-            )
-            # without authentication stay, work, etc: bool -> binary
-            feature = "P3.noAuthStay"
-            data_dict[feature] = True if data_dict[feature] == "Y" else False
-            # deported or refused entry: bool -> binary
-            feature = "P3.refuseDeport"
-            data_dict[feature] = True if data_dict[feature] == "Y" else False
-            # previously applied: bool -> binary
-            feature = "P3.BGI2.PrevApply"
-            data_dict[feature] = True if data_dict[feature] == "Y" else False
-            # criminal record: bool -> binary
-            feature = "P3.PWrapper.criminalRec"
-            data_dict[feature] = True if data_dict[feature] == "Y" else False
-            # military record: bool -> binary
-            feature = "P3.PWrapper.Military.Choice"
-            data_dict[feature] = True if data_dict[feature] == "Y" else False
-            # political, violent movement record: bool -> binary
-            feature = "P3.PWrapper.politicViol"
-            data_dict[feature] = True if data_dict[feature] == "Y" else False
-            # witness of ill treatment: bool -> binary
-            feature = "P3.PWrapper.witnessIllTreat"
-            data_dict[feature] = True if data_dict[feature] == "Y" else False
             return data_dict
 
         if doc_type == DocTypes.CANADA_5645E:
-            # XFA to XML
-            xml = canada_xfa.extract_raw_content(path)
-            xml = canada_xfa.clean_xml_for_csv(xml=xml, type=DocTypes.CANADA_5645E)
-            # XML to flattened dict
-            data_dict = canada_xfa.xml_to_flattened_dict(xml=xml)
-            data_dict = canada_xfa.flatten_dict(data_dict)
+            # XFA to flattened dict
+            data_dict = flattened_dict
+            if data_dict is None:
+                data_dict = _extract_flattened(path=path, doc_type=doc_type)
             # clean flattened dict
             data_dict = functional.dict_summarizer(
                 data_dict,
@@ -582,254 +538,271 @@ class CanadaDataDictPreprocessor(DataDictPreprocessor):
 
             self.data_dict = data_dict
 
-            # drop pepeg keys
-            functional.drop(dictionary=data_dict, keys=CANADA_5645E_DROP_COLUMNS)
+            # drop pepeg keys and all Accompany=No (only rely on Accompany=Yes using
+            #   binary state) in a single pass
+            functional.drop(
+                dictionary=data_dict,
+                keys=[
+                    k for k in data_dict if k in CANADA_5645E_DROP_COLUMNS or "No" in k
+                ],
+            )
             # transform multiple pleb keys into a single chad one and fixing key data types
             # type of application: (already one hot) string -> int
-            keys = [key for key in list(data_dict.keys()) if "p1.Subform1" in key]
+            keys = [key for key in data_dict if key.startswith("p1.Subform1")]
             for k in keys:
-                data_dict = self.change_dtype(
-                    key_name=k,
-                    dtype=int,
-                    if_nan="fill",
-                    value=int(CanadaFillna.VISA_APPLICATION_TYPE_5645E),
+                _apply(
+                    data_dict,
+                    k,
+                    int,
+                    "fill",
+                    int(CanadaFillna.VISA_APPLICATION_TYPE_5645E),
                 )
-            # drop all Accompany=No and only rely on Accompany=Yes using binary state
-            self.key_dropper(string="No", inplace=True)
-            # applicant marriage status: string to integer
-            data_dict = self.change_dtype(
-                key_name="p1.SecA.App.ChdMStatus",
-                dtype=int,
-                if_nan="fill",
-                value=int(CanadaFillna.CHILD_MARRIAGE_STATUS_5645E),
-            )
             # validation date of information, i.e. current date: datetime
-            data_dict = self.change_dtype(
-                key_name="p1.SecC.SecCdate",
-                dtype=parser.parse,
-                if_nan="fill",
-                value=self.base_date,
+            _apply(
+                data_dict, "p1.SecC.SecCdate", parse_datetime, "fill", self.base_date
             )
-            # spouse date of birth: string -> datetime
-            data_dict = self.change_dtype(
-                key_name="p1.SecA.Sps.SpsDOB",
-                dtype=parser.parse,
-                if_nan="fill",
-                value=data_dict["p1.SecC.SecCdate"],
+            # cast fields that are handled one by one
+            fills = {_FORM_DATE: data_dict["p1.SecC.SecCdate"]}
+            for key, dtype, if_nan, value in _CANADA_5645E_SCHEMA:
+                _apply(data_dict, key, dtype, if_nan, fills.get(value, value))
+            # values from XML are already strings, so only missing ones are filled
+            data_dict.update(
+                {k: v for k, v in _CANADA_5645E_FILLS if data_dict[k] is None}
             )
+            # binary fields: true_value=True, anything else=False
+            for key, true_value in _CANADA_5645E_FLAGS:
+                data_dict[key] = data_dict[key] == true_value
 
-            # spouse country of birth: string -> categorical
-            data_dict = self.change_dtype(
-                key_name="p1.SecA.Sps.SpsCOB", dtype=str, if_nan="skip"
-            )
-            # spouse occupation type (issue #2): string -> categorical
-            data_dict = self.change_dtype(
-                key_name="p1.SecA.Sps.SpsOcc",
-                dtype=str,
-                if_nan="fill",
-                value=CanadaFillna.OCCUPATION_5257E,
+            # children's status
+            # number of tags of children and siblings sections
+            tag_counts = functional.count_keys_by_prefix(
+                data_dict, ("p1.SecB.Chd", "p1.SecC.Chd")
             )
-            # spouse accompanying: coming=True or not_coming=False
-            feature = "p1.SecA.Sps.SpsAccomp"
-            data_dict[feature] = True if data_dict[feature] == "1" else False
-            # mother date of birth: string -> datetime
-            data_dict = self.change_dtype(
-                key_name="p1.SecA.Mo.MoDOB",
-                dtype=parser.parse,
-                if_nan="fill",
-                value=data_dict["p1.SecC.SecCdate"],
+            CHILDREN_MAX_FEATURES = 7
+            n_children = tag_counts["p1.SecB.Chd"] // CHILDREN_MAX_FEATURES
+            _normalize_kin(
+                data_dict, "p1.SecB.Chd", n_children, data_dict["p1.SecC.SecCdate"]
             )
 
-            # mother occupation type (issue #2): string -> categorical
-            data_dict = self.change_dtype(
-                key_name="p1.SecA.Mo.MoOcc",
-                dtype=str,
-                if_nan="fill",
-                value=CanadaFillna.OCCUPATION_5257E,
-            )
-            # mother marriage status: int -> categorical
-            data_dict = self.change_dtype(
-                key_name="p1.SecA.Mo.ChdMStatus",
-                dtype=int,
-                if_nan="fill",
-                value=int(CanadaFillna.CHILD_MARRIAGE_STATUS_5645E),
-            )
-            # mother accompanying: coming=True or not_coming=False
-            feature = "p1.SecA.Mo.MoAccomp"
-            data_dict[feature] = True if data_dict[feature] == "1" else False
-            # father date of birth: string -> datetime
-            data_dict = self.change_dtype(
-                key_name="p1.SecA.Fa.FaDOB",
-                dtype=parser.parse,
-                if_nan="fill",
-                value=data_dict["p1.SecC.SecCdate"],
+            # siblings' status
+            SIBLINGS_MAX_FEATURES = 8
+            n_siblings = tag_counts["p1.SecC.Chd"] // SIBLINGS_MAX_FEATURES
+            _normalize_kin(
+                data_dict, "p1.SecC.Chd", n_siblings, data_dict["p1.SecC.SecCdate"]
             )
 
-            # mother occupation type (issue #2): string -> categorical
-            data_dict = self.change_dtype(
-                key_name="p1.SecA.Fa.FaOcc",
-                dtype=str,
-                if_nan="fill",
-                value=CanadaFillna.OCCUPATION_5257E,
-            )
-            # father marriage status: int -> categorical
-            data_dict = self.change_dtype(
-                key_name="p1.SecA.Fa.ChdMStatus",
-                dtype=int,
-                if_nan="fill",
-                value=int(CanadaFillna.CHILD_MARRIAGE_STATUS_5645E),
-            )
-            # father accompanying: coming=True or not_coming=False
-            feature = "p1.SecA.Fa.FaAccomp"
-            data_dict[feature] = True if data_dict[feature] == "1" else False
+            return data_dict
 
-            # children's status
-            children_tag_list = [
-                c for c in list(data_dict.keys()) if "p1.SecB.Chd" in c
-            ]
-            CHILDREN_MAX_FEATURES = 7
-            for i in range(len(children_tag_list) // CHILDREN_MAX_FEATURES):
-                # child's marriage status 01: string to integer
-                data_dict = self.change_dtype(
-                    key_name="p1.SecB.Chd.[" + str(i) + "].ChdMStatus",
-                    dtype=int,
-                    if_nan="fill",
-                    value=int(CanadaFillna.CHILD_MARRIAGE_STATUS_5645E),
-                )
-                # child's relationship 01: string -> categorical
-                data_dict = self.change_dtype(
-                    key_name="p1.SecB.Chd.[" + str(i) + "].ChdRel",
-                    dtype=str,
-                    if_nan="fill",
-                    value=CanadaFillna.CHILD_RELATION_5645E,
-                )
-                # child's date of birth 01: string -> datetime
-                data_dict = self.change_dtype(
-                    key_name="p1.SecB.Chd.[" + str(i) + "].ChdDOB",
-                    dtype=parser.parse,
-                    if_nan="skip",
-                )
+        if doc_type == DocTypes.CANADA_LABEL:
+            # the label file only contains the visa result
+            with open(path) as f:
+                label = f.read().strip()
+            try:
+                visa_result = int(label)
+            except ValueError:  # empty (i.e. missing) or bad label
+                visa_result = int(CanadaFillna.VISA_RESULT)
+
+            data_dict = {"VisaResult": visa_result}
+            self.data_dict = data_dict
+            return data_dict
 
-                # child's country of birth 01: string -> categorical
-                data_dict = self.change_dtype(
-                    key_name="p1.SecB.Chd.[" + str(i) + "].ChdCOB",
-                    dtype=str,
-                    if_nan="fill",
-                    value=CanadaFillna.COUNTRY_5257E,
-                )
-                # child's occupation type 01 (issue #2): string -> categorical
-                data_dict = self.change_dtype(
-                    key_name="p1.SecB.Chd.[" + str(i) + "].ChdOcc",
-                    dtype=str,
-                    if_nan="fill",
-                    value=CanadaFillna.OCCUPATION_5257E,
-                )
-                # child's marriage status: int -> categorical
-                data_dict = self.change_dtype(
-                    key_name="p1.SecB.Chd.[" + str(i) + "].ChdMStatus",
-                    dtype=int,
-                    if_nan="fill",
-                    value=int(CanadaFillna.CHILD_MARRIAGE_STATUS_5645E),
-                )
-                # child's accompanying 01: coming=True or not_coming=False
-                feature = "p1.SecB.Chd.[" + str(i) + "].ChdAccomp"
-                data_dict[feature] = True if data_dict[feature] == "1" else False
-
-                # check if the child does not exist and fill it properly (ghost case monkaS)
-                if (
-                    (
-                        data_dict["p1.SecB.Chd.[" + str(i) + "].ChdMStatus"]
-                        == CanadaFillna.CHILD_MARRIAGE_STATUS_5645E
-                    )
-                    and (data_dict["p1.SecB.Chd.[" + str(i) + "].ChdRel"] == "OTHER")
-                    and (data_dict["p1.SecB.Chd.[" + str(i) + "].ChdDOB"] is None)
-                    and (data_dict["p1.SecB.Chd.[" + str(i) + "].ChdAccomp"] == False)
-                ):
-                    # ghost child's date of birth: None -> datetime (current date) -> 0 days
-                    data_dict = self.change_dtype(
-                        key_name="p1.SecB.Chd.[" + str(i) + "].ChdDOB",
-                        dtype=parser.parse,
-                        if_nan="fill",
-                        value=data_dict["p1.SecC.SecCdate"],
-                    )
+    def process_batch(
+        self,
+        documents: list[tuple[DocTypes, str]],
+        max_workers: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """Transforms many XFA forms while extracting their content in parallel
 
-            # siblings' status
-            siblings_tag_list = [
-                c for c in list(data_dict.keys()) if "p1.SecC.Chd" in c
-            ]
-            SIBLINGS_MAX_FEATURES = 8
-            for i in range(len(siblings_tag_list) // SIBLINGS_MAX_FEATURES):
-                # sibling's marriage status 01: string to integer
-                data_dict = self.change_dtype(
-                    key_name="p1.SecC.Chd.[" + str(i) + "].ChdMStatus",
-                    dtype=int,
-                    if_nan="fill",
-                    value=int(CanadaFillna.CHILD_MARRIAGE_STATUS_5645E),
-                )
-                # sibling's relationship 01: string -> categorical
-                data_dict = self.change_dtype(
-                    key_name="p1.SecC.Chd.[" + str(i) + "].ChdRel",
-                    dtype=str,
-                    if_nan="fill",
-                    value=CanadaFillna.CHILD_RELATION_5645E,
-                )
-                # sibling's date of birth 01: string -> datetime
-                data_dict = self.change_dtype(
-                    key_name="p1.SecC.Chd.[" + str(i) + "].ChdDOB",
-                    dtype=parser.parse,
-                    if_nan="skip",
-                )
+        Extracting the XFA content of a PDF into a flattened dictionary is CPU bound
+        XML parsing, so it is done in a pool of worker processes. The rest of
+        :meth:`file_specific_basic_transform` runs serially in the given order,
+        hence a 5645E form can still fall back on the date of a preceding 5257E form.
 
-                # sibling's country of birth 01: string -> categorical
-                data_dict = self.change_dtype(
-                    key_name="p1.SecC.Chd.[" + str(i) + "].ChdCOB",
-                    dtype=str,
-                    if_nan="fill",
-                    value=CanadaFillna.COUNTRY_5257E,
-                )
-                # sibling's occupation type 01 (issue #2): string -> categorical
-                data_dict = self.change_dtype(
-                    key_name="p1.SecC.Chd.[" + str(i) + "].ChdOcc",
-                    dtype=str,
-                    if_nan="fill",
-                    value=CanadaFillna.OCCUPATION_5257E,
-                )
-                # sibling's accompanying: coming=True or not_coming=False
-                feature = "p1.SecC.Chd.[" + str(i) + "].ChdAccomp"
-                data_dict[feature] = True if data_dict[feature] == "1" else False
-
-                # check if the sibling does not exist and fill it properly (ghost case monkaS)
-                if (
-                    (
-                        data_dict["p1.SecC.Chd.[" + str(i) + "].ChdMStatus"]
-                        == CanadaFillna.CHILD_MARRIAGE_STATUS_5645E
-                    )
-                    and (data_dict["p1.SecC.Chd.[" + str(i) + "].ChdRel"] == "OTHER")
-                    and (data_dict["p1.SecC.Chd.[" + str(i) + "].ChdOcc"] is None)
-                    and (data_dict["p1.SecC.Chd.[" + str(i) + "].ChdAccomp"] == False)
-                ):
-                    # ghost sibling's date of birth: None -> datetime (current date) -> 0 days
-                    data_dict = self.change_dtype(
-                        key_name="p1.SecC.Chd.[" + str(i) + "].ChdDOB",
-                        dtype=parser.parse,
-                        if_nan="fill",
-                        value=data_dict["p1.SecC.SecCdate"],
-                    )
+        Args:
+            documents (list[tuple[DocTypes, str]]): Pairs of document type (one of
+                ``DocTypes.CANADA_5257E`` or ``DocTypes.CANADA_5645E``) and path
+            max_workers (Optional[int], optional): Number of worker processes.
+                Defaults to None (i.e. ``os.cpu_count()``).
 
-            return data_dict
+        Returns:
+            list[dict[str, Any]]: Transformed dictionaries in the order of ``documents``
+        """
 
-        if doc_type == DocTypes.CANADA_LABEL:
-            with open(path, newline="") as f:
-                data_dict = csv.DictReader(f, delimiter=" ", fieldnames=["VisaResult"])
-
-            functional.change_dtype(
-                data_dict=data_dict,
-                key_name="VisaResult",
-                dtype=int,
-                if_nan="fill",
-                value=int(CanadaFillna.VISA_RESULT),
+        doc_types = [doc_type for doc_type, _ in documents]
+        paths = [path for _, path in documents]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            flattened_dicts = list(executor.map(_extract_flattened, paths, doc_types))
+
+        return [
+            self.file_specific_basic_transform(
+                doc_type=doc_type, path=path, flattened_dict=flattened_dict
             )
-            return data_dict
+            for doc_type, path, flattened_dict in zip(doc_types, paths, flattened_dicts)
+        ]
+
+
+def _extract_flattened(path: str, doc_type: DocTypes) -> dict[str, Any]:
+    """Extracts the XFA content of a Canada form as a flattened dictionary
+
+    Note:
+        This is a module level function so it can be sent to worker processes.
+
+    Args:
+        path (str): Path to the input document
+        doc_type (DocTypes): The input document type
+            (see :class:`DocTypes <cvfe.data.constant.DocTypes>`)
+
+    Returns:
+        dict[str, Any]: Flattened dictionary of the XML content of the form
+    """
+
+    # XFA to XML
+    xml = _CANADA_XFA.extract_raw_content(path)
+    xml = _CANADA_XFA.clean_xml_for_csv(xml=xml, type=doc_type)
+    # XML to flattened dict
+    data_dict = _CANADA_XFA.xml_to_flattened_dict(xml=xml)
+    return _CANADA_XFA.flatten_dict(data_dict)
+
+
+# fields of each child (`p1.SecB.Chd`) or sibling (`p1.SecC.Chd`) in the 5645E form
+_KIN_FIELDS = ("ChdMStatus", "ChdRel", "ChdDOB", "ChdCOB", "ChdOcc", "ChdAccomp")
+# fill values of the fields of children and siblings
+_KIN_MARRIAGE_STATUS_FILL = int(CanadaFillna.CHILD_MARRIAGE_STATUS_5645E)
+_KIN_RELATION_FILL = CanadaFillna.CHILD_RELATION_5645E
+_KIN_COUNTRY_FILL = CanadaFillna.COUNTRY_5257E
+_KIN_OCCUPATION_FILL = CanadaFillna.OCCUPATION_5257E
+
+
+@functools.lru_cache(maxsize=None)
+def _kin_keys(section: str, i: int) -> dict[str, str]:
+    """Keys of the fields of the ``i`` th child or sibling of the 5645E form
+
+    Note:
+        Results are cached, so the keys are built (and interned) once per row.
+        The returned dictionary is shared and must not be modified.
+
+    Args:
+        section (str): Key of the section, e.g. ``'p1.SecB.Chd'``
+        i (int): Index of the row in the section
+
+    Returns:
+        dict[str, str]: A dictionary of field names to their keys, e.g.
+            ``'ChdRel'`` to ``'p1.SecB.Chd.[0].ChdRel'``
+    """
+    return {field: sys.intern(f"{section}.[{i}].{field}") for field in _KIN_FIELDS}
+
+
+def _is_ghost_kin(data_dict: dict[str, Any], row_keys: dict[str, str]) -> bool:
+    """Checks if a child or sibling row of the 5645E form is empty (ghost case monkaS)
+
+    A row is empty when all its fields have been filled with their fill values and
+    the date of birth (which is not filled) is missing, i.e. the person does not exist.
+
+    Args:
+        data_dict (dict[str, Any]): A dictionary of the (casted) 5645E form
+        row_keys (dict[str, str]): Keys of the fields of the row (see :func:`_kin_keys`)
+
+    Note:
+        ``ChdAccomp`` is always a ``bool`` at this point, so it is compared by
+        identity. Marriage status and relation are compared by value since they
+        may come from the form itself rather than the fill values.
+
+    Returns:
+        bool: True if the row is empty
+    """
+    # cheapest (identity) checks first, most rows exit on the first one
+    return (
+        data_dict[row_keys["ChdDOB"]] is None
+        and data_dict[row_keys["ChdAccomp"]] is False
+        and data_dict[row_keys["ChdRel"]] == "OTHER"
+        and data_dict[row_keys["ChdMStatus"]] == _KIN_MARRIAGE_STATUS_FILL
+    )
+
+
+def _normalize_kin(
+    data_dict: dict[str, Any], section: str, n: int, form_date: Optional[str]
+) -> None:
+    """Casts the fields of the children or siblings rows of the 5645E form in-place
+
+    Args:
+        data_dict (dict[str, Any]): A dictionary of the 5645E form
+        section (str): Key of the section, ``'p1.SecB.Chd'`` for children or
+            ``'p1.SecC.Chd'`` for siblings
+        n (int): Number of rows in the section
+        form_date (Optional[str]): Date of the form, used as the date of birth of
+            empty rows
+    """
+
+    for i in range(n):
+        row_keys = _kin_keys(section, i)
+        # marriage status 01: string to integer
+        _apply(
+            data_dict, row_keys["ChdMStatus"], int, "fill", _KIN_MARRIAGE_STATUS_FILL
+        )
+        # relationship 01: string -> categorical
+        _apply(data_dict, row_keys["ChdRel"], str, "fill", _KIN_RELATION_FILL)
+        # date of birth 01: string -> datetime
+        _apply(data_dict, row_keys["ChdDOB"], parse_datetime, "skip", None)
+        # country of birth 01: string -> categorical
+        _apply(data_dict, row_keys["ChdCOB"], str, "fill", _KIN_COUNTRY_FILL)
+        # occupation type 01 (issue #2): string -> categorical
+        _apply(data_dict, row_keys["ChdOcc"], str, "fill", _KIN_OCCUPATION_FILL)
+        # accompanying 01: coming=True or not_coming=False
+        feature = row_keys["ChdAccomp"]
+        data_dict[feature] = data_dict.get(feature) == _CHECKED
+
+        # check if the person does not exist and fill it properly (ghost case monkaS)
+        if _is_ghost_kin(data_dict, row_keys):
+            # ghost date of birth: None -> datetime (current date) -> 0 days
+            _apply(data_dict, row_keys["ChdDOB"], parse_datetime, "fill", form_date)
+
+
+def _apply(
+    data_dict: dict[str, Any], key: str, dtype: Callable, if_nan: str, value: Any
+) -> None:
+    """Positional and in-place :func:`cvfe.data.functional.change_dtype` for ``'skip'`` and ``'fill'``
+
+    Note:
+        Values that are already exactly of type ``dtype`` are left as is. Date parsers
+        are not types, so dates (stored as ISO strings) are always parsed.
+
+    Args:
+        data_dict (dict[str, Any]): A dictionary that ``key`` will be searched on
+        key (str): Desired key name of the dictionary
+        dtype (Callable): target data type as a function e.g. ``float``
+        if_nan (str): ``'skip'`` to leave ``None`` s or ``'fill'`` to fill them
+        value (Any): The value to fill ``None`` s with if ``if_nan='fill'``
+    """
+
+    x = data_dict[key]
+    if x is not None:
+        # already casted, e.g. on a second pass (exact type, `bool` is a subclass of `int`)
+        if type(x) is not dtype:
+            data_dict[key] = functional.cast_value(x, dtype)
+    elif if_nan == "fill":
+        data_dict[key] = value
+
+
+def _apply_row(
+    data_dict: dict[str, Any],
+    row_key: str,
+    row_schema: tuple[tuple[str, Callable, str, Any], ...],
+    fills: dict[object, Any],
+) -> None:
+    """Casts the fields of one row of a repeated form section via :func:`_apply`
+
+    Args:
+        data_dict (dict[str, Any]): A dictionary that the fields will be searched on
+        row_key (str): Key of the row that its fields are prefixed with,
+            e.g. ``'P3.Occ.OccRow1'``
+        row_schema (tuple[tuple[str, Callable, str, Any], ...]): ``(field, dtype,
+            if_nan, value)`` of the fields of the row
+        fills (dict[object, Any]): Values of the placeholders used as ``value``
+            in ``row_schema``
+    """
+
+    for field, dtype, if_nan, value in row_schema:
+        _apply(data_dict, f"{row_key}.{field}", dtype, if_nan, fills.get(value, value))
 
 
 class FileTransform:
@@ -859,6 +832,9 @@ class CopyFile(FileTransform):
     Default is set to 'cf', i.e. `shutil.copyfile`. For more info see
     shutil_ documentation.
 
+    Note:
+        On Linux, `shutil` already copies regular files through the zero-copy
+        ``os.sendfile`` fast-path (Python 3.8+), so no special handling is needed.
 
     Reference:
         1. https://stackoverflow.com/a/30359308/18971263
@@ -918,8 +894,16 @@ class MakeContentCopyProtectedMachineReadable(FileTransform):
         Returns:
             Any: None
         """
-        pdf = pikepdf.open(src, allow_overwriting_input=True)
-        pdf.save(dst)
+        # only the encryption is dropped, hence streams are copied as they are
+        #   (no decode/re-encode) and object streams are kept untouched
+        with pikepdf.open(src, allow_overwriting_input=True) as pdf:
+            pdf.save(
+                dst,
+                object_stream_mode=pikepdf.ObjectStreamMode.preserve,
+                stream_decode_level=pikepdf.StreamDecodeLevel.none,
+                normalize_content=False,
+                linearize=False,
+            )
 
 
 class FileTransformCompose:
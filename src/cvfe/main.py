@@ -1,5 +1,6 @@
 import argparse
 import logging
+import os
 
 try:
     import fastapi
@@ -14,6 +15,10 @@ from cvfe.api import apps as api_apps
 from cvfe.api import models as api_models
 from cvfe.api.convert.adobe_xfa import router as adobe_xfa_router
 
+# host and port, when not ran as a script (e.g. imported by an ASGI server or tests)
+BIND = os.getenv("CVFE_BIND", "0.0.0.0")
+PORT = int(os.getenv("CVFE_PORT", "8000"))
+
 # argparse
 parser = argparse.ArgumentParser()
 parser.add_argument(
@@ -30,16 +35,16 @@ parser.add_argument(
     "--bind",
     type=str,
     help="ip address of host",
-    default="0.0.0.0",
-    required=True,
+    default=BIND,
+    required=False,
 )
 parser.add_argument(
     "-p",
     "--port",
     type=int,
     help="port used for creating the gunicorn server",
-    default=8000,
-    required=True,
+    default=PORT,
+    required=False,
 )
 parser.add_argument(
     "-w",
@@ -56,7 +61,10 @@ parser.add_argument(
     help="URL of the third-party endpoint to send the post request",
     required=False,
 )
-args = parser.parse_args()
+# only parse command line args when ran as a script, not on import
+if __name__ == "__main__":
+    args = parser.parse_args()
+    BIND, PORT = args.bind, args.port
 
 # globals
 VERBOSE = logging.DEBUG
@@ -66,37 +74,47 @@ logger = logging.getLogger(__name__)
 logger.setLevel(VERBOSE)
 
 
-# instantiate FastAPI app and NGROK (optional)
-app = fastapi.FastAPI()
-settings = api_apps.Settings()
-
-# fastapi cross origin
-origins = ["*"]
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+def create_app() -> fastapi.FastAPI:
+    """Creates the FastAPI app with its middlewares and routers
 
-if settings.USE_NGROK:
-    api_apps.init_ngrok(host=args.bind, port=args.port)
+    Returns:
+        fastapi.FastAPI: A new app, e.g. to be served or used by a test client
+    """
+
+    app = fastapi.FastAPI()
 
+    # fastapi cross origin
+    origins = ["*"]
 
-app.include_router(adobe_xfa_router)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    app.include_router(adobe_xfa_router)
+    return app
+
+
+# instantiate FastAPI app and NGROK (optional)
+app = create_app()
+settings = api_apps.get_settings()
+
+if settings.USE_NGROK:
+    api_apps.init_ngrok(host=BIND, port=PORT)
 
 if __name__ == "__main__":
     options = {
-        "bind": f"{args.bind}:{args.port}",
+        "bind": f"{BIND}:{PORT}",
         "workers": args.workers,
         "worker_class": "uvicorn.workers.UvicornWorker",
     }
     # api_apps.StandaloneApplication(app=app, options=options).run()
     uvicorn.run(
         app=app,
-        host=args.bind,
-        port=args.port,
+        host=BIND,
+        port=PORT,
         workers=args.workers,
     )
@@ -1,4 +1,6 @@
+import functools
 import importlib
+import sys
 
 
 def safe_import(import_path: str, classname: str, dep_group: str):
@@ -13,7 +15,7 @@ def safe_import(import_path: str, classname: str, dep_group: str):
     """
 
     try:
-        module = importlib.import_module(import_path)
+        module = _get_module(import_path)
         retrieved_class = vars(module).get(classname)
         if retrieved_class is None:
             raise ImportError(f"Failed to import '{classname}' from '{import_path}'")
@@ -22,6 +24,19 @@ def safe_import(import_path: str, classname: str, dep_group: str):
     return retrieved_class
 
 
+@functools.lru_cache(maxsize=None)
+def _get_module(import_path: str):
+    """Imports a module once, reusing the already imported one if any
+
+    See :func:`cvfe.utils.import_utils.safe_import`
+    """
+
+    module = sys.modules.get(import_path)
+    if module is None:
+        module = importlib.import_module(import_path)
+    return module
+
+
 def _missing_dependency_stub_factory(
     classname: str, dep_group: str, import_error: Exception
 ):
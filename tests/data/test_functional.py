@@ -0,0 +1,154 @@
+import datetime
+
+from dateutil import parser
+
+from cvfe.data import functional
+from cvfe.data.constant import DocTypes
+from cvfe.data.preprocessor import CopyFile, FileTransformCompose
+
+
+def test_flatten_dict():
+    nested = {
+        "p1": {
+            "SecA": {"Name": "foo", "DOB": None},
+            "Chd": [{"Name": "bar"}, {"Name": "baz", "Rel": {"Rel": "SON"}}],
+        },
+        "formNum": "5645",
+    }
+
+    assert functional.flatten_dict(nested) == {
+        "p1.SecA.Name": "foo",
+        "p1.SecA.DOB": None,
+        "p1.Chd.[0].Name": "bar",
+        "p1.Chd.[1].Name": "baz",
+        "p1.Chd.[1].Rel.Rel": "SON",
+        "formNum": "5645",
+    }
+
+
+def test_aggregate_datetime_prefix_index():
+    data_dict = {
+        "P1.PD.CurrCOR.Row2.Country": "IRAN",
+        "P1.PD.CurrCOR.Row2.FromDate": "2020-01-01",
+        "P1.PD.CurrCOR.Row2.ToDate": "2021-01-01",
+    }
+    prefix_index = functional.build_prefix_index(data_dict)
+
+    for index in (None, prefix_index):
+        aggregated = functional.aggregate_datetime(
+            data_dict=dict(data_dict),
+            key_base_name="P1.PD.CurrCOR.Row2",
+            new_key_name="Period",
+            doc_type=DocTypes.CANADA_5257E,
+            prefix_index=index,
+        )
+        assert aggregated == {
+            "P1.PD.CurrCOR.Row2.Country": "IRAN",
+            "P1.PD.CurrCOR.Row2.Period": 366,
+        }
+
+
+def test_count_keys_by_prefix():
+    data_dict = {
+        "p1.SecB.Chd.[0].ChdRel": None,
+        "p1.SecB.Chd.[1].ChdRel": None,
+        "p1.SecC.Chd.[0].ChdRel": None,
+        "p1.SecB.ChdCount": None,
+    }
+    assert functional.count_keys_by_prefix(
+        data_dict, ("p1.SecB.Chd.", "p1.SecC.Chd.", "p1.SecD.")
+    ) == {"p1.SecB.Chd.": 2, "p1.SecC.Chd.": 1, "p1.SecD.": 0}
+
+
+def test_fillna_datetime():
+    data_dict = {
+        "P3.Occ.OccRow1.FromYear": None,
+        "P3.Occ.OccRow1.ToYear": "2023",
+        "P3.Occ.OccRow1.Country": None,
+    }
+
+    filled = functional.fillna_datetime(
+        data_dict=data_dict,
+        key_base_name="P3.Occ.OccRow1",
+        date="2020",
+        doc_type=DocTypes.CANADA_5257E,
+        one_sided=True,
+    )
+
+    assert filled == {
+        "P3.Occ.OccRow1.FromYear": "2020",
+        "P3.Occ.OccRow1.ToYear": "2023",
+        "P3.Occ.OccRow1.Country": None,
+    }
+    # not inplace: the original must not change
+    assert data_dict["P3.Occ.OccRow1.FromYear"] is None
+
+    assert (
+        functional.fillna_datetime(
+            data_dict=data_dict,
+            key_base_name="P3.Occ.OccRow1",
+            date="2020",
+            doc_type=DocTypes.CANADA_5257E,
+            one_sided=True,
+            inplace=True,
+        )
+        is None
+    )
+    assert data_dict == filled
+
+
+def test_dict_to_csv(tmp_path):
+    path = tmp_path / "data.csv"
+
+    functional.dict_to_csv({"a": 1, "b": None, "c": "x,y"}, path=path)
+
+    assert path.read_text() == 'a,b,c\n1,,"x,y"\n'
+
+
+def test_parse_datetime():
+    default = datetime.datetime(year=datetime.MINYEAR, month=1, day=1)
+
+    for timestr in (
+        "2023-08-08",
+        "2023-08-08T10:20:30",
+        "1996",
+        "1990/02/28",
+        "Jun 8 2020",
+    ):
+        assert functional.parse_datetime(timestr) == parser.parse(
+            timestr, default=default
+        )
+
+    # cached
+    assert functional.parse_datetime("Jun 8 2020") is functional.parse_datetime(
+        "Jun 8 2020"
+    )
+
+
+def test_cast_value_datetime():
+    date = datetime.datetime(2023, 8, 8)
+
+    for dtype in (functional.parse_datetime, parser.parse):
+        assert functional.cast_value(date, dtype) == "2023-08-08T00:00:00"
+        assert functional.cast_value("2023-08-08", dtype) == "2023-08-08T00:00:00"
+        # MMDDYYYY format of Canada forms
+        assert functional.cast_value("08082023", dtype) == "2023-08-08T00:00:00"
+
+
+def test_process_directory(tmp_path):
+    src_dir = tmp_path / "src"
+    (src_dir / "x").mkdir(parents=True)
+    for i in range(3):
+        (src_dir / "x" / f"{i}.txt").write_text(str(i))
+    compose = FileTransformCompose(transforms={CopyFile(mode="cf"): ".txt"})
+
+    for max_workers in (1, 2):
+        dst_dir = tmp_path / f"dst_{max_workers}"
+        functional.process_directory(
+            src_dir=src_dir.as_posix(),
+            dst_dir=dst_dir.as_posix(),
+            compose=compose,
+            max_workers=max_workers,
+        )
+        for i in range(3):
+            assert (dst_dir / "x" / f"{i}.txt").read_text() == str(i)
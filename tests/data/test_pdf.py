@@ -0,0 +1,14 @@
+from cvfe.data.pdf import PDFIO
+
+
+def test_find_in_dict_nested():
+    haystack = {"/Root": {"/AcroForm": {"/XFA": ["datasets", "xml"]}}}
+
+    assert PDFIO().find_in_dict("/XFA", haystack) == ["datasets", "xml"]
+
+
+def test_find_in_dict_cyclic():
+    haystack = {"/Root": {}}
+    haystack["/Root"]["/Parent"] = haystack
+
+    assert PDFIO().find_in_dict("/XFA", haystack) is None
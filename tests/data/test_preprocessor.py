@@ -0,0 +1,82 @@
+import json
+from typing import Any
+
+from cvfe.data.constant import CanadaFillna, DocTypes
+from cvfe.data.preprocessor import (
+    CanadaDataDictPreprocessor,
+    MakeContentCopyProtectedMachineReadable,
+    _normalize_kin,
+)
+
+
+def test_convert_country_code_to_name():
+    preprocessor = CanadaDataDictPreprocessor()
+
+    assert preprocessor.convert_country_code_to_name("223") == "Iran"
+    assert preprocessor.convert_country_code_to_name("252") == "Afghanistan"
+    assert (
+        preprocessor.convert_country_code_to_name("22")
+        == CanadaFillna.COUNTRY_CODE_5257E
+    )
+
+
+def test_canada_label(tmp_path):
+    preprocessor = CanadaDataDictPreprocessor()
+
+    label_path = tmp_path / "label.txt"
+    label_path.write_text("1\n")
+    assert preprocessor.file_specific_basic_transform(
+        doc_type=DocTypes.CANADA_LABEL, path=label_path.as_posix()
+    ) == {"VisaResult": 1}
+
+    label_path.write_text("")
+    assert preprocessor.file_specific_basic_transform(
+        doc_type=DocTypes.CANADA_LABEL, path=label_path.as_posix()
+    ) == {"VisaResult": CanadaFillna.VISA_RESULT}
+
+
+def test_normalize_kin_ghost_rows():
+    form_date = "2023-08-08T00:00:00"
+    fields = ("ChdMStatus", "ChdRel", "ChdDOB", "ChdCOB", "ChdOcc", "ChdAccomp")
+
+    # empty (ghost) children and siblings rows get the form date as date of birth
+    for section in ("p1.SecB.Chd", "p1.SecC.Chd"):
+        data_dict = {f"{section}.[0].{field}": None for field in fields}
+        _normalize_kin(data_dict, section, 1, form_date)
+        assert data_dict == {
+            f"{section}.[0].ChdMStatus": CanadaFillna.CHILD_MARRIAGE_STATUS_5645E,
+            f"{section}.[0].ChdRel": CanadaFillna.CHILD_RELATION_5645E,
+            f"{section}.[0].ChdDOB": form_date,
+            f"{section}.[0].ChdCOB": CanadaFillna.COUNTRY_5257E,
+            f"{section}.[0].ChdOcc": CanadaFillna.OCCUPATION_5257E,
+            f"{section}.[0].ChdAccomp": False,
+        }
+
+    # a row with a known date of birth is kept as is
+    data_dict = {f"p1.SecC.Chd.[0].{field}": None for field in fields}
+    data_dict["p1.SecC.Chd.[0].ChdDOB"] = "1995-07-12"
+    _normalize_kin(data_dict, "p1.SecC.Chd", 1, form_date)
+    assert data_dict["p1.SecC.Chd.[0].ChdDOB"] == "1995-07-12T00:00:00"
+
+
+def test_process_batch(tmp_path):
+    with open("tests/assets/filled/response_fake_correct.json", "rb") as f:
+        correct_response: dict[str, dict[str, Any]] = json.load(f)
+
+    # forms are protected, so make them machine readable first
+    documents = []
+    for doc_type, fname in [
+        (DocTypes.CANADA_5257E, "imm5257e_fake.pdf"),
+        (DocTypes.CANADA_5645E, "imm5645e_fake.pdf"),
+    ]:
+        dst = (tmp_path / fname).as_posix()
+        MakeContentCopyProtectedMachineReadable()(f"tests/assets/filled/{fname}", dst)
+        documents.append((doc_type, dst))
+
+    preprocessor = CanadaDataDictPreprocessor()
+    given_response = preprocessor.process_batch(documents=documents, max_workers=2)
+
+    assert given_response == [
+        correct_response[DocTypes.CANADA_5257E.name],
+        correct_response[DocTypes.CANADA_5645E.name],
+    ]
@@ -14,10 +14,9 @@ pytest.importorskip(
 from fastapi import status
 from starlette.testclient import TestClient
 
-from cvfe.main import app
+from cvfe.main import create_app
 
 # globals
-test_client = TestClient(app=app)
 ASSETS_PATH = Path("tests/assets")
 DUMMY_FILES_PATH = ASSETS_PATH / Path("dummy")
 FILLED_FILES_PATH = ASSETS_PATH / Path("filled")
@@ -27,15 +26,28 @@ FILLED_FILES_PATH = ASSETS_PATH / Path("filled")
 #   1. no need to define headers for requests: for some reason it throws error in multipart
 
 
-def test_read_main():
+@pytest.fixture(scope="session")
+def test_client() -> TestClient:
+    return TestClient(app=create_app())
+
+
+def test_read_main(test_client: TestClient):
     response = test_client.get("/")
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_bad_files():
+def test_bad_files(test_client: TestClient):
     files = {
-        "form_5257": open(DUMMY_FILES_PATH / Path("dummy_1.pdf"), "rb"),
-        "form_5645": open(DUMMY_FILES_PATH / Path("dummy_2.pdf"), "rb"),
+        "form_5257": (
+            "dummy_1.pdf",
+            (DUMMY_FILES_PATH / "dummy_1.pdf").read_bytes(),
+            "application/pdf",
+        ),
+        "form_5645": (
+            "dummy_2.pdf",
+            (DUMMY_FILES_PATH / "dummy_2.pdf").read_bytes(),
+            "application/pdf",
+        ),
     }
 
     response = test_client.post(url="/cvfe/v1/convert/adobe_xfa/", files=files)
@@ -43,17 +55,24 @@ def test_bad_files():
     assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
-def test_good_files():
+def test_good_files(test_client: TestClient):
     files = {
-        "form_5257": open(FILLED_FILES_PATH / Path("imm5257e_fake.pdf"), "rb"),
-        "form_5645": open(FILLED_FILES_PATH / Path("imm5645e_fake.pdf"), "rb"),
+        "form_5257": (
+            "imm5257e_fake.pdf",
+            (FILLED_FILES_PATH / "imm5257e_fake.pdf").read_bytes(),
+            "application/pdf",
+        ),
+        "form_5645": (
+            "imm5645e_fake.pdf",
+            (FILLED_FILES_PATH / "imm5645e_fake.pdf").read_bytes(),
+            "application/pdf",
+        ),
     }
 
     response = test_client.post(url="/cvfe/v1/convert/adobe_xfa/", files=files)
 
     assert response.status_code == status.HTTP_200_OK
 
-    correct_response: dict[str, dict[str, Any]] = open(
-        "tests/assets/filled/response_fake_correct.json", "rb"
-    )
-    assert response.json() == json.load(correct_response)
+    with open(FILLED_FILES_PATH / "response_fake_correct.json", "rb") as f:
+        correct_response: dict[str, dict[str, Any]] = json.load(f)
+    assert response.json() == correct_response